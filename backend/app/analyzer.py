@@ -1,8 +1,18 @@
+from bisect import bisect_left, bisect_right
 from typing import Dict
-import re
+import hashlib
+import os
+import time
+from pathlib import Path
 
+import numpy as np
 
-from .rules.catalog import RULES, Rule
+
+from .cache import ResultCache
+from . import catalogs, profiler
+from .numeric import NUM_WORDS, TIME_UNIT_NAMES
+from .rules.compiled import CompiledRule, CompiledRuleSet, KeywordScan
+from .text_utils import NormalizedText, locate_spans, normalize as _normalize
 #
 # -------------------------
 # Document Type Detection
@@ -18,8 +28,8 @@ NON_CONTRACT_KEYWORDS = [
     "skills", "projects", "certifications", "summary"
 ]
 
-def detect_document_type(document_text: str) -> dict:
-    text = _normalize(document_text)
+def detect_document_type(document_text: "str | NormalizedText") -> dict:
+    text = NormalizedText.of(document_text).normalized
 
     contract_score = sum(2 for kw in CONTRACT_KEYWORDS if kw in text)
     non_contract_score = sum(2 for kw in NON_CONTRACT_KEYWORDS if kw in text)
@@ -64,23 +74,10 @@ OBLIGATION_CONTEXTS = {
 # Clause-level Evidence Helpers
 # -------------------------
 
-def _extract_matched_keywords(rule: Rule, text: str) -> list[str]:
-    matched = []
-    norm_text = _normalize(text)
-    for kw in getattr(rule, "keywords", []):
-        if _normalize(kw) in norm_text:
-            matched.append(kw)
-    for ph in getattr(rule, "phrases", []):
-        if _normalize(ph) in norm_text:
-            matched.append(ph)
-    return list(dict.fromkeys(matched))
-
-
-def _extract_matching_sentence(text: str, keywords: list[str]) -> str | None:
+def _extract_matching_sentence(text: NormalizedText, keywords: list[str]) -> str | None:
     if not keywords:
         return None
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    for sentence in sentences:
+    for sentence in text.sentences:
         s_norm = sentence.lower()
         for kw in keywords:
             if kw.lower() in s_norm:
@@ -94,70 +91,290 @@ def _extract_matching_sentence(text: str, keywords: list[str]) -> str | None:
 
 NEGATIONS = {"not", "no", "without", "never", "none"}
 
+# Two keyword tokens at most this many tokens apart earn a proximity bonus
+PROXIMITY_WINDOW = 6
+
+
+# -------------------------
+# Compiled Keyword Matching
+# -------------------------
 
-def _normalize(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+def _proximity_bonus(entry: CompiledRule, scan: KeywordScan, window: int = PROXIMITY_WINDOW) -> int:
+    # Each token's positions are already ascending and distinct tokens never
+    # share a position, so two hits are within the window iff some pair of
+    # neighbours in the merged order is.
+    positions = sorted(
+        i for pid in entry.tokens for i in scan.token_positions.get(pid, ())
+    )
+    for prev, cur in zip(positions, positions[1:]):
+        if cur - prev <= window:
+            return 1
+    return 0
 
 
-def _tokenize(text: str):
-    return _normalize(text).split()
+def _extract_matched_keywords(entry: CompiledRule, scan: KeywordScan) -> list[str]:
+    matched = [kw for kw, pid in entry.keywords if pid in scan.present]
+    matched += [ph for ph, pid in entry.phrases if pid in scan.present]
+    return list(dict.fromkeys(matched))
 
 
-def _is_negated(keyword: str, tokens: list[str], idx: int) -> bool:
-    start = max(0, idx - 3)
-    return any(tok in NEGATIONS for tok in tokens[start:idx])
+# -------------------------
+# Vectorized Scoring
+# -------------------------
 
+def _incidence(compiled: CompiledRuleSet, pattern_ids) -> np.ndarray:
+    """(pattern x rule) matrix counting how often each rule lists each pattern."""
+    matrix = np.zeros((len(compiled.patterns), len(compiled.rules)), dtype=np.int64)
+    for col, entry in enumerate(compiled.rules):
+        for pid in pattern_ids(entry):
+            matrix[pid, col] += 1
+    return matrix
+
+
+class RiskCatalog:
+    """
+    One version of the keyword rules (see catalogs.Catalogs), ready for
+    scoring: the compiled rule set, its incidence matrices and per-rule
+    arrays, and the cache of clause results computed from it.
+    """
+
+    __slots__ = ("compiled", "single_keywords", "present_keywords", "min_hits", "keyword_count", "risk_rank", "cache")
+
+    def __init__(self, compiled: CompiledRuleSet):
+        self.compiled = compiled
+        rules = compiled.rules
+        # Single-token keywords count every non-negated whole-token occurrence;
+        # multi-token keywords and phrases count once if present anywhere.
+        self.single_keywords = _incidence(compiled, lambda e: e.single)
+        self.present_keywords = _incidence(compiled, lambda e: e.multi + tuple(pid for _, pid in e.phrases))
+        self.min_hits = np.array([e.min_hits for e in rules], dtype=np.int64)
+        self.keyword_count = np.array([e.keyword_count for e in rules], dtype=np.int64)
+        self.risk_rank = np.array([e.risk_rank for e in rules], dtype=np.int64)
+        self.cache = ResultCache(
+            maxsize=CLAUSE_CACHE_SIZE,
+            db_path=CLAUSE_CACHE_DB,
+            version=_cache_version(compiled),
+        )
 
-def _count_keyword_hits(rule: Rule, text: str) -> int:
-    tokens = _tokenize(text)
-    hits = 0
-    for kw in getattr(rule, "keywords", []):
-        kw_norm = _normalize(kw)
-        kw_tokens = kw_norm.split()
-        if len(kw_tokens) == 1:
-            for i, tok in enumerate(tokens):
-                if tok == kw_tokens[0]:
-                    hits += 0 if _is_negated(kw_tokens[0], tokens, i) else 1
+
+def _hit_matrix(
+    catalog: RiskCatalog,
+    scans: list[KeywordScan],
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> tuple[np.ndarray, list[int]]:
+    """
+    Effective hits as a (text x rule) matrix with one row per scan, and the
+    number of rules the index let each row skip. Proximity is only computed
+    for rules with an anchor present.
+    """
+    n_patterns, n_rules = catalog.single_keywords.shape
+    counts = np.zeros((len(scans), n_patterns), dtype=np.int64)
+    present = np.zeros((len(scans), n_patterns), dtype=np.int64)
+    prox = np.zeros((len(scans), n_rules), dtype=np.int64)
+    skipped = []
+
+    rules = catalog.compiled.rules
+    # Per row, seconds spent scoring each candidate rule (profiling only)
+    timings = [] if profiler.ENABLED else None
+    for row, scan in enumerate(scans):
+        present[row, list(scan.present)] = 1
+        negated = scan.negated
+        for pid, positions in scan.token_positions.items():
+            counts[row, pid] = sum(1 for i in positions if i not in negated) if negated else len(positions)
+        candidates = catalog.compiled.index.candidates(scan.present)
+        if timings is None:
+            for col in candidates:
+                prox[row, col] = _proximity_bonus(rules[col], scan, proximity_window)
         else:
-            phrase = " ".join(kw_tokens)
-            if phrase in " ".join(tokens):
-                hits += 1
-    return hits
-
-
-def _phrase_hits(rule: Rule, text: str) -> int:
-    phrases = getattr(rule, "phrases", [])
-    if not phrases:
-        return 0
-    t = _normalize(text)
-    return sum(1 for p in phrases if _normalize(p) in t)
-
-
-def _proximity_bonus(rule: Rule, text: str) -> int:
-    tokens = _tokenize(text)
-    kws = [t for k in getattr(rule, "keywords", []) for t in _normalize(k).split()]
-    positions = []
-    for i, tok in enumerate(tokens):
-        if tok in kws:
-            positions.append(i)
-    for i in range(len(positions)):
-        for j in range(i + 1, len(positions)):
-            if abs(positions[i] - positions[j]) <= 6:
-                return 1
-    return 0
+            timings.append(_timed_proximity(rules, candidates, scan, prox[row], proximity_window))
+        skipped.append(n_rules - len(candidates))
+
+    hits = counts @ catalog.single_keywords + present @ catalog.present_keywords + prox
+    hits = np.maximum(hits, 0)
+    if timings is not None:
+        _record_profile(catalog, hits, timings)
+    return hits, skipped
+
+
+def _timed_proximity(rules, candidates, scan: KeywordScan, prox_row: np.ndarray, proximity_window: int) -> dict:
+    timings = {}
+    for col in candidates:
+        start = time.perf_counter()
+        prox_row[col] = _proximity_bonus(rules[col], scan, proximity_window)
+        timings[col] = time.perf_counter() - start
+    return timings
+
+
+def _record_profile(catalog: RiskCatalog, hits: np.ndarray, timings: list[dict]):
+    # An evaluation is a candidate rule scored for one text; it hits when it
+    # reaches its min_hits
+    confidence = _confidence_scores(catalog, hits)
+    rules = catalog.compiled.rules
+    samples = []
+    for row, row_timings in enumerate(timings):
+        for col, seconds in row_timings.items():
+            hit = bool(hits[row, col] >= catalog.min_hits[col])
+            samples.append((col, rules[col].rule.id, seconds, hit, int(confidence[row, col]) if hit else None))
+    profiler.record("analyzer", samples)
+
+
+def _confidence_scores(catalog: RiskCatalog, hits: np.ndarray) -> np.ndarray:
+    return np.minimum(100, (hits / catalog.keyword_count * 100).astype(np.int64))
+
+
+def _top_findings(
+    catalog: RiskCatalog,
+    scans: list[KeywordScan],
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> list[tuple]:
+    """
+    Headline rule for each scan as (compiled rule or None, confidence,
+    rules_skipped): highest risk first, then highest confidence, then
+    catalog order among ties.
+    """
+    hits, skipped = _hit_matrix(catalog, scans, proximity_window)
+    confidence = _confidence_scores(catalog, hits)
+    ranking = np.where(hits >= catalog.min_hits, catalog.risk_rank * 1000 + confidence, -1)
+    best = ranking.argmax(axis=1)
+
+    findings = []
+    for row, col in enumerate(best):
+        if ranking[row, col] < 0:
+            findings.append((None, 0, skipped[row]))
+        else:
+            findings.append((catalog.compiled.rules[col], int(confidence[row, col]), skipped[row]))
+    return findings
+
+
+# -------------------------
+# Top Finding Only (branch and bound)
+# -------------------------
+
+def _confidence(hits: int, keyword_count: int) -> int:
+    # Same arithmetic as _confidence_scores
+    return min(100, int(hits / keyword_count * 100))
+
+
+def _top_finding_bounded(
+    catalog: RiskCatalog,
+    scan: KeywordScan,
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> tuple:
+    """
+    The headline rule _top_findings would pick for one scan, as (compiled
+    rule or None, confidence, rules_skipped, rules_scored).
+
+    Rules are visited by descending risk: once a risk tier has a qualifying
+    rule, no lower tier can win. Within a tier, each rule's hits are bounded
+    by its keyword counts plus the largest possible proximity bonus (1), and
+    rules are scored in order of that bound until none left can beat the
+    best so far. Proximity, the costly part, is only computed for rules
+    actually scored.
+    """
+    rules = catalog.compiled.rules
+    candidates = catalog.compiled.index.candidates(scan.present)
+    rules_skipped = len(rules) - len(candidates)
+
+    negated = scan.negated
+    counts = {
+        pid: sum(1 for i in positions if i not in negated) if negated else len(positions)
+        for pid, positions in scan.token_positions.items()
+    }
+    present = scan.present
+
+    tiers: dict[int, list[tuple]] = {}
+    for col in candidates:
+        entry = rules[col]
+        base = sum(counts.get(pid, 0) for pid in entry.single)
+        base += sum(1 for pid in entry.multi if pid in present)
+        base += sum(1 for _, pid in entry.phrases if pid in present)
+        # Proximity needs two keyword-token hits
+        bonus = 1 if sum(len(scan.token_positions.get(pid, ())) for pid in entry.tokens) > 1 else 0
+        if base + bonus < entry.min_hits:
+            continue
+        bound = _confidence(base + bonus, entry.keyword_count)
+        tiers.setdefault(entry.risk_rank, []).append((-bound, col, base, bonus))
+
+    rules_scored = 0
+    for risk_rank in sorted(tiers, reverse=True):
+        best = None
+        for neg_bound, col, base, bonus in sorted(tiers[risk_rank]):
+            if best is not None and (-neg_bound, -col) <= (best[1], -best[0]):
+                break
+            entry = rules[col]
+            rules_scored += 1
+            hits = base
+            if bonus:
+                hits += _proximity_bonus(entry, scan, proximity_window)
+            if hits < entry.min_hits:
+                continue
+            confidence = _confidence(hits, entry.keyword_count)
+            if best is None or (confidence, -col) > (best[1], -best[0]):
+                best = (col, confidence)
+        if best is not None:
+            return rules[best[0]], best[1], rules_skipped, rules_scored
+    return None, 0, rules_skipped, rules_scored
+
+
+_HEADLINE_FIELDS = (
+    "clause_type", "risk_level", "confidence", "explanation", "suggestion",
+    "triggered_keywords", "matched_sentence",
+)
 
 
-def _confidence_score(hits: int, total_keywords: int) -> int:
-    if total_keywords <= 0:
-        return 0
-    return min(100, int((hits / total_keywords) * 100))
+def analyze_clause_top(
+    clause_text: "str | NormalizedText",
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> Dict:
+    """
+    Only the headline finding of analyze_clause (type, risk, confidence,
+    explanation, suggestion, keywords, sentence), for clients that render
+    nothing else, plus how many rules were skipped and scored. Rules are
+    scored by branch and bound and the deadline, percentage and money
+    extraction is skipped. A clause already in the cache scores no rule
+    and reports the rules its cached analysis skipped, as /analyze does.
+    """
+    catalog = catalogs.current().analyzer
+    clause = NormalizedText.of(clause_text)
+    cached = catalog.cache.get(_clause_key(catalog, clause, proximity_window))
+    if cached is not None:
+        result = {field: cached[field] for field in _HEADLINE_FIELDS}
+        result["rules_skipped"] = cached["rules_skipped"]
+        result["rules_scored"] = 0
+        return result
+
+    scan = catalog.compiled.scan(clause)
+    entry, confidence, rules_skipped, rules_scored = _top_finding_bounded(catalog, scan, proximity_window)
+    if entry is None:
+        return {
+            "clause_type": "General",
+            "risk_level": "Low",
+            "confidence": 0,
+            "explanation": "No legal risk detected, but important obligations may apply.",
+            "suggestion": None,
+            "triggered_keywords": [],
+            "matched_sentence": None,
+            "rules_skipped": rules_skipped,
+            "rules_scored": rules_scored,
+        }
 
+    rule = entry.rule
+    matched_keywords = _extract_matched_keywords(entry, scan)
+    return {
+        "clause_type": rule.title,
+        "risk_level": rule.risk_level,
+        "confidence": confidence,
+        "explanation": rule.description,
+        "suggestion": rule.suggestion,
+        "triggered_keywords": matched_keywords,
+        "matched_sentence": _extract_matching_sentence(clause, matched_keywords),
+        "rules_skipped": rules_skipped,
+        "rules_scored": rules_scored,
+    }
 
-def _classify_obligation(text: str) -> str | None:
-    t = text.lower()
+
+def _classify_obligation(text: NormalizedText) -> str | None:
+    t = text.lower
     for label, keywords in OBLIGATION_CONTEXTS.items():
         if any(k in t for k in keywords):
             return label
@@ -182,13 +399,8 @@ def explain_obligation(obligation: str | None) -> str | None:
 # Time Extraction Helpers
 # -------------------------
 
-# Patterns for numbers written as digits or words (up to 99)
-NUM_WORDS = {
-    "one":1, "two":2, "three":3, "four":4, "five":5, "six":6, "seven":7, "eight":8, "nine":9,
-    "ten":10, "eleven":11, "twelve":12, "thirteen":13, "fourteen":14, "fifteen":15,
-    "sixteen":16, "seventeen":17, "eighteen":18, "nineteen":19, "twenty":20,
-    "thirty":30, "forty":40, "fifty":50, "sixty":60, "seventy":70, "eighty":80, "ninety":90
-}
+# NUM_WORDS, TIME_UNITS and TIME_PATTERN live in numeric.py, next to the
+# scanner that finds their matches.
 
 def _word_to_num(word: str) -> int | None:
     word = word.lower()
@@ -208,38 +420,13 @@ def _word_to_num(word: str) -> int | None:
         return total if total > 0 else None
     return None
 
-# Regex to capture time expressions like "3 years", "three (3) years", "90-day cure period", "within 48 hrs"
-TIME_UNITS = {
-    "years": r"years?|yrs?|y",
-    "months": r"months?|mos?|mth",
-    "weeks": r"weeks?|wks?|w",
-    "days": r"days?|d",
-    "hours": r"hours?|hrs?|h",
-}
-
-# Build a combined regex pattern to match numbers and units
-# Capture number (word or digit), optional parenthetical number, then unit
-TIME_PATTERN = re.compile(
-    r"\b(?P<num_word>\w+)?\s*(\(?\s*(?P<num_digit>\d+)\s*\))?\s*(?P<unit>" +
-    "|".join(TIME_UNITS.values()) +
-    r")\b",
-    re.IGNORECASE
-)
-
-def _extract_time_values(text: str) -> list[dict]:
+def _extract_time_values(text: NormalizedText) -> list[dict]:
     results = []
-    for match in TIME_PATTERN.finditer(text):
+    for match in text.numbers.times:
         num_word = match.group("num_word")
         num_digit = match.group("num_digit")
-        unit_raw = match.group("unit").lower()
-        # Normalize unit to singular form used in output
-        unit = None
-        for key, pattern in TIME_UNITS.items():
-            if re.fullmatch(pattern, unit_raw, re.IGNORECASE):
-                unit = key
-                break
-        if not unit:
-            continue
+        # Normalize unit to the TIME_UNITS key used in output
+        unit = TIME_UNIT_NAMES[match.group("unit").casefold()]
         # Determine value: prefer digit if present, else parse word
         value = None
         if num_digit:
@@ -263,11 +450,7 @@ def _extract_time_values(text: str) -> list[dict]:
 # Percentage & Money Extraction Helpers
 # -------------------------
 
-PERCENT_PATTERN = re.compile(
-    r"(?P<value>\d+(?:\.\d+)?)\s*%"
-)
-
-NUMBER_PATTERN = re.compile(r"\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b")
+# PERCENT_PATTERN and NUMBER_PATTERN live in numeric.py
 
 MONEY_CONTEXT_WORDS = {
     "fee", "fees", "penalty", "fine",
@@ -276,10 +459,11 @@ MONEY_CONTEXT_WORDS = {
 
 TIME_UNITS_SIMPLE = ["day", "days", "month", "months", "year", "years", "hrs", "hours"]
 
-def _extract_percentages(text: str) -> list[dict]:
+def _extract_percentages(doc: NormalizedText) -> list[dict]:
+    text = doc.text
     results = []
 
-    for m in PERCENT_PATTERN.finditer(text):
+    for m in doc.numbers.percents:
         value = float(m.group("value"))
         raw = m.group(0)
 
@@ -356,15 +540,21 @@ def classify_deadline(value: int, unit: str) -> str:
         return "normal"
     return "long"
 
-def _extract_money(text: str) -> list[dict]:
+def _extract_money(doc: NormalizedText) -> list[dict]:
+    text = doc.text
     results = []
-    for match in NUMBER_PATTERN.finditer(text):
+    # Percentage spans are disjoint and in text order
+    percent_starts, percent_ends = [], []
+    for m in doc.numbers.percents:
+        percent_starts.append(m.start())
+        percent_ends.append(m.end())
+    sentence_windows: dict[int, str] = {}
+    for match in doc.numbers.numbers:
         raw = match.group(0)
         # Strengthen: skip if number is part of a percentage match
-        if PERCENT_PATTERN.search(text[max(0, match.start()-1):match.end()+1]):
-            continue
-        # Skip if number is immediately followed by '%'
-        if match.end() < len(text) and text[match.end()] == '%':
+        # (this also covers a number immediately followed by '%')
+        p = bisect_right(percent_starts, match.end() - 1) - 1
+        if p >= 0 and percent_ends[p] > match.start():
             continue
         # Skip if nearby text (±5 chars) contains time units like day, days, month, months, year, years, hrs, hours
         start_context = max(0, match.start() - 5)
@@ -382,18 +572,13 @@ def _extract_money(text: str) -> list[dict]:
         # Remove 'interest' from context words (already done above)
         # Explicitly skip numbers that are part of a percentage match (already above)
         # Find the sentence containing the number
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        sentence_found = None
-        match_start = match.start()
-        match_end = match.end()
-        char_count = 0
-        for sent in sentences:
-            sent_len = len(sent)
-            if char_count <= match_start < char_count + sent_len:
-                sentence_found = sent
-                break
-            char_count += sent_len + 1  # +1 for the split char
-        window = sentence_found.lower() if sentence_found else text[max(0, match.start()-50):match.end()+50].lower()
+        sentence_idx = doc.sentence_at(match.start())
+        if sentence_idx is None:
+            window = text[max(0, match.start()-50):match.end()+50].lower()
+        else:
+            window = sentence_windows.get(sentence_idx)
+            if window is None:
+                window = sentence_windows[sentence_idx] = doc.sentences[sentence_idx].lower()
         has_currency = any(sym in window for sym in ("$", "usd", "dollar"))
         has_money_context = any(word in window for word in MONEY_CONTEXT_WORDS)
         # Rule (a): currency symbol/word in same sentence
@@ -421,41 +606,59 @@ def _extract_money(text: str) -> list[dict]:
 
 
 # -------------------------
-# Clause Analysis
+# Clause Result Cache
 # -------------------------
 
-def analyze_clause(clause_text: str) -> Dict:
-    normalized = _normalize(clause_text)
-    candidates = []
+CLAUSE_CACHE_SIZE = int(os.getenv("CLARISCAN_CLAUSE_CACHE_SIZE", "2048"))
+CLAUSE_CACHE_DB = os.getenv("CLARISCAN_CLAUSE_CACHE_DB")
 
-    for rule in RULES:
-        kw_hits = _count_keyword_hits(rule, normalized)
-        ph_hits = _phrase_hits(rule, normalized)
-        prox = _proximity_bonus(rule, normalized)
-        effective_hits = max(0, kw_hits + ph_hits + prox)
 
-        if effective_hits < rule.min_hits:
-            continue
+def _cache_version(compiled: CompiledRuleSet) -> str:
+    """Catalog content hash plus the source of the code that interprets it."""
+    digest = hashlib.sha256(compiled.version.encode("utf-8"))
+    here = Path(__file__).parent
+    for source in ("analyzer.py", "numeric.py", "text_utils.py", "rules/compiled.py"):
+        digest.update((here / source).read_bytes())
+    return digest.hexdigest()[:16]
 
-        confidence = _confidence_score(
-            effective_hits,
-            max(1, len(getattr(rule, "keywords", [])))
-        )
 
-        matched_keywords = _extract_matched_keywords(rule, clause_text)
-        candidates.append({
-            "rule": rule,
-            "confidence": confidence,
-            "matched_keywords": matched_keywords,
-        })
+def _clause_key(catalog: RiskCatalog, clause: NormalizedText, proximity_window: int) -> str:
+    # Keyed on the exact clause text: deadlines, money and the matched
+    # sentence are all reported verbatim, so normalized text is not enough.
+    digest = hashlib.sha256(f"{catalog.cache.version}:{proximity_window}:".encode("utf-8"))
+    digest.update(clause.text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+# -------------------------
+# Clause Analysis
+# -------------------------
+
+def analyze_clause(
+    clause_text: "str | NormalizedText",
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> Dict:
+    catalog = catalogs.current().analyzer
+    clause = NormalizedText.of(clause_text)
+    key = _clause_key(catalog, clause, proximity_window)
+    result = catalog.cache.get(key)
+    if result is None:
+        scan = catalog.compiled.scan(clause)
+        result = _analyze_clause(clause, scan, _top_findings(catalog, [scan], proximity_window)[0])
+        catalog.cache.put(key, result)
+    return result
+
+
+def _analyze_clause(clause: NormalizedText, scan: KeywordScan, top: tuple) -> Dict:
+    entry, confidence, rules_skipped = top
 
     # Replace time_constraints and percentages extraction with normalized versions
     time_constraints = []
-    for t in _extract_time_values(clause_text):
+    for t in _extract_time_values(clause):
         t["severity"] = classify_deadline(t["value"], t["unit"])
         time_constraints.append(t)
     # Infer context for time_constraints based on obligation type
-    obligation = _classify_obligation(clause_text)
+    obligation = _classify_obligation(clause)
     for t in time_constraints:
         if obligation == "termination":
             t["applies_to"] = "termination notice"
@@ -472,10 +675,10 @@ def analyze_clause(clause_text: str) -> Dict:
             t["applies_to"] = "contractual reference period"
             t["trigger"] = "Contractual limitation or reference"
 
-    percentages = [normalize_percentage(p) for p in _extract_percentages(clause_text)]
-    money_values = _extract_money(clause_text)
+    percentages = [normalize_percentage(p) for p in _extract_percentages(clause)]
+    money_values = _extract_money(clause)
 
-    obligation = _classify_obligation(clause_text)
+    obligation = _classify_obligation(clause)
     user_must_know = {
         "obligation": obligation,
         "obligation_explanation": explain_obligation(obligation),
@@ -496,7 +699,7 @@ def analyze_clause(clause_text: str) -> Dict:
             f"{p['value']}% {p.get('context', 'rate')}"
         )
 
-    if not candidates:
+    if entry is None:
         # Ensure percentages always appear in both analysis and user_must_know
         user_must_know["percentages"] = percentages
         return {
@@ -513,16 +716,11 @@ def analyze_clause(clause_text: str) -> Dict:
             "user_must_know": user_must_know,
             "obligation_type": obligation,
             "important_but_not_risky": important_info,
+            "rules_skipped": rules_skipped,
         }
 
-    risk_rank = {"High": 3, "Medium": 2, "Low": 1}
-    candidates.sort(
-        key=lambda x: (risk_rank[x["rule"].risk_level], x["confidence"]),
-        reverse=True,
-    )
-
-    rule = candidates[0]["rule"]
-    matched_keywords = _extract_matched_keywords(rule, clause_text)
+    rule = entry.rule
+    matched_keywords = _extract_matched_keywords(entry, scan)
     # time_constraints and percentages already set above
     user_must_know["percentages"] = percentages
     return {
@@ -530,15 +728,16 @@ def analyze_clause(clause_text: str) -> Dict:
         "risk_level": rule.risk_level,
         "explanation": rule.description,
         "suggestion": rule.suggestion,
-        "confidence": candidates[0]["confidence"],
+        "confidence": confidence,
         "triggered_keywords": matched_keywords,
-        "matched_sentence": _extract_matching_sentence(clause_text, matched_keywords),
+        "matched_sentence": _extract_matching_sentence(clause, matched_keywords),
         "time_constraints": time_constraints if time_constraints else [],
         "user_must_know": user_must_know,
         "percentages": percentages,
         "money": money_values,
         "obligation_type": obligation,
         "important_but_not_risky": important_info,
+        "rules_skipped": rules_skipped,
     }
 
 
@@ -546,8 +745,67 @@ def analyze_clause(clause_text: str) -> Dict:
 # Document Analysis
 # -------------------------
 
-def analyze_document(document_text: str) -> Dict:
-    doc_type_info = detect_document_type(document_text)
+class _TimeContextIndex:
+    """
+    Finds the context keyword for a time expression: the first occurrence
+    of its words in the document with a keyword within 10 tokens. Built on
+    the document's token->positions map, and each distinct wording is
+    resolved once, so repeated deadlines cost linear time overall.
+    """
+
+    WINDOW = 10
+
+    def __init__(self, document: NormalizedText, context_keywords: set[str]):
+        self.tokens = document.tokens
+        self.positions = document.token_positions
+        self.context_keywords = context_keywords
+        self.resolved: dict[tuple, str | None] = {}
+
+    def _keyword_near(self, start: int, end: int) -> str | None:
+        # Same keyword precedence as scanning the window with `kw in window`
+        for kw in self.context_keywords:
+            hits = self.positions.get(kw, ())
+            i = bisect_left(hits, start)
+            if i < len(hits) and hits[i] < end:
+                return kw
+        return None
+
+    def lookup(self, words: list[str]) -> str | None:
+        key = tuple(words)
+        if key in self.resolved:
+            return self.resolved[key]
+
+        tokens = self.tokens
+        n = len(words)
+        starts = self.positions.get(words[0], ()) if words else range(len(tokens) + 1)
+        found = None
+        for pos in starts:
+            if tokens[pos:pos + n] != words:
+                continue
+            start = max(0, pos - self.WINDOW)
+            end = min(len(tokens), pos + n + self.WINDOW)
+            found = self._keyword_near(start, end)
+            if found:
+                break
+        self.resolved[key] = found
+        return found
+
+
+def analyze_document(
+    document_text: "str | NormalizedText",
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> Dict:
+    catalog = catalogs.current().analyzer
+    return _analyze_document(catalog, NormalizedText.of(document_text), None, proximity_window)
+
+
+def _analyze_document(
+    catalog: RiskCatalog,
+    document: NormalizedText,
+    scan: KeywordScan | None,
+    proximity_window: int,
+) -> Dict:
+    doc_type_info = detect_document_type(document)
     if doc_type_info["document_type"] == "non_contract":
         return {
             "document_type": "non_contract",
@@ -555,71 +813,48 @@ def analyze_document(document_text: str) -> Dict:
             "reason": doc_type_info["reason"],
             "message": "Please upload a legal contract such as a lease, employment agreement, NDA, or service contract.",
         }
-    normalized = _normalize(document_text)
-    findings = []
     time_obligations = []
 
     # Keywords to infer context around time obligations
     CONTEXT_KEYWORDS = {"termination", "cure", "notice", "report", "payment"}
 
-    for rule in RULES:
-        kw_hits = _count_keyword_hits(rule, normalized)
-        ph_hits = _phrase_hits(rule, normalized)
-        prox = _proximity_bonus(rule, normalized)
-        effective_hits = max(0, kw_hits + ph_hits + prox)
+    if scan is None:
+        scan = catalog.compiled.scan(document)
+    hits, _ = _hit_matrix(catalog, [scan], proximity_window)
+    confidence = _confidence_scores(catalog, hits)[0]
+    hits = hits[0]
 
-        if effective_hits < rule.min_hits:
-            continue
-
-        confidence = _confidence_score(
-            effective_hits,
-            max(1, len(getattr(rule, "keywords", [])))
-        )
+    # ---- Deduplicate findings by rule ID (keep highest confidence) ----
+    deduped = {}
+    for col in np.flatnonzero(hits >= catalog.min_hits):
+        rule_id = catalog.compiled.rules[col].rule.id
+        existing = deduped.get(rule_id)
+        if existing is None or confidence[col] > confidence[existing]:
+            deduped[rule_id] = col
+    finding_cols = np.fromiter(deduped.values(), dtype=np.int64, count=len(deduped))
 
+    findings = []
+    for col in finding_cols:
+        rule = catalog.compiled.rules[col].rule
         findings.append({
             "id": rule.id,
             "title": rule.title,
             "risk_level": rule.risk_level,
             "description": rule.description,
             "suggestion": rule.suggestion,
-            "matched_keywords": effective_hits,
-            "confidence": confidence,
+            "matched_keywords": int(hits[col]),
+            "confidence": int(confidence[col]),
         })
 
-    # ---- Deduplicate findings by rule ID (keep highest confidence) ----
-    deduped = {}
-    for f in findings:
-        existing = deduped.get(f["id"])
-        if not existing or f["confidence"] > existing["confidence"]:
-            deduped[f["id"]] = f
-    findings = list(deduped.values())
-
     # Extract time obligations and percentages from document text
-    extracted_times = _extract_time_values(document_text)
-    doc_percents = [normalize_percentage(p) for p in _extract_percentages(document_text)]
-    doc_money = _extract_money(document_text)
+    extracted_times = _extract_time_values(document)
+    doc_percents = [normalize_percentage(p) for p in _extract_percentages(document)]
+    doc_money = _extract_money(document)
     # For each time found, try to find context word near it (within 10 words)
-    doc_tokens = _tokenize(document_text)
+    time_context = _TimeContextIndex(document, CONTEXT_KEYWORDS)
     for time_entry in extracted_times:
-        # Find position(s) of raw_text in tokens to get context
         raw_text = time_entry["raw_text"].lower()
-        raw_words = _normalize(raw_text).split()
-        positions = []
-        for i in range(len(doc_tokens) - len(raw_words) + 1):
-            if doc_tokens[i:i+len(raw_words)] == raw_words:
-                positions.append(i)
-        context_found = None
-        for pos in positions:
-            # Look +/- 10 tokens for context keywords
-            start = max(0, pos - 10)
-            end = min(len(doc_tokens), pos + len(raw_words) + 10)
-            window = doc_tokens[start:end]
-            for kw in CONTEXT_KEYWORDS:
-                if kw in window:
-                    context_found = kw
-                    break
-            if context_found:
-                break
+        context_found = time_context.lookup(_normalize(raw_text).split())
         obligation = None
         applies_to = None
         trigger = None
@@ -659,10 +894,10 @@ def analyze_document(document_text: str) -> Dict:
         unique[key] = t
     time_obligations = list(unique.values())
 
-    weights = {"High": 3, "Medium": 2, "Low": 1}
     if findings:
-        total_weight = sum(weights[f["risk_level"]] * f["confidence"] for f in findings)
-        max_weight = sum(weights[f["risk_level"]] * 100 for f in findings)
+        weights = catalog.risk_rank[finding_cols]
+        total_weight = int((weights * confidence[finding_cols]).sum())
+        max_weight = int(weights.sum()) * 100
         document_risk_score = int((total_weight / max_weight) * 100) if max_weight else 0
     else:
         document_risk_score = 0
@@ -687,4 +922,95 @@ def analyze_document(document_text: str) -> Dict:
             "percentages": doc_percents,
             "money": doc_money,
         },
-    }
\ No newline at end of file
+    }
+
+
+# -------------------------
+# Batch Analysis
+# -------------------------
+
+def analyze_clauses(
+    clauses: list[str],
+    document_text: "str | NormalizedText | None" = None,
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> Dict:
+    """
+    Analyze every clause of one document from a single keyword scan.
+
+    Each clause result equals analyze_clause(clause) and the summary equals
+    analyze_document(document_text); both are read from one scan of the
+    document. Without document_text the joined clauses stand in for it.
+    """
+    catalog = catalogs.current().analyzer
+    if document_text is None:
+        document_text = " ".join(clauses)
+    document = NormalizedText.of(document_text)
+    parsed = [NormalizedText.of(c) for c in clauses]
+    keys, results = _cached_clauses(catalog, parsed, proximity_window)
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    spans = locate_spans(document, [parsed[i] for i in missing])
+    doc_scan, span_scans = catalog.compiled.scan_spans(
+        document, [span for span in spans if span is not None]
+    )
+    span_scans = iter(span_scans)
+
+    scans = [
+        next(span_scans) if span is not None else catalog.compiled.scan(parsed[i])
+        for i, span in zip(missing, spans)
+    ]
+    fresh = _analyze_scanned(catalog, [parsed[i] for i in missing], scans, proximity_window)
+    _store_clauses(catalog, keys, results, missing, fresh)
+
+    return {
+        "clauses": results,
+        "document_summary": _analyze_document(catalog, document, doc_scan, proximity_window),
+    }
+
+
+def analyze_clause_batch(
+    clauses: list[str],
+    proximity_window: int = PROXIMITY_WINDOW,
+) -> list[Dict]:
+    """
+    Analyze independent clauses as one scoring batch, without a document
+    summary. Each result equals analyze_clause(clause).
+    """
+    catalog = catalogs.current().analyzer
+    parsed = [NormalizedText.of(c) for c in clauses]
+    keys, results = _cached_clauses(catalog, parsed, proximity_window)
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    scans = [catalog.compiled.scan(parsed[i]) for i in missing]
+    fresh = _analyze_scanned(catalog, [parsed[i] for i in missing], scans, proximity_window)
+    _store_clauses(catalog, keys, results, missing, fresh)
+    return results
+
+
+def _cached_clauses(
+    catalog: RiskCatalog,
+    parsed: list[NormalizedText],
+    proximity_window: int,
+) -> tuple[list[str], list]:
+    """Cache keys for every clause and their cached results (None on a miss)."""
+    keys = [_clause_key(catalog, clause, proximity_window) for clause in parsed]
+    return keys, [catalog.cache.get(key) for key in keys]
+
+
+def _store_clauses(catalog: RiskCatalog, keys: list[str], results: list, missing: list[int], fresh: list[Dict]):
+    for i, result in zip(missing, fresh):
+        results[i] = result
+    catalog.cache.put_many([(keys[i], results[i]) for i in missing])
+
+
+def _analyze_scanned(
+    catalog: RiskCatalog,
+    parsed: list[NormalizedText],
+    scans: list[KeywordScan],
+    proximity_window: int,
+) -> list[Dict]:
+    tops = _top_findings(catalog, scans, proximity_window) if scans else []
+    return [
+        _analyze_clause(clause, scan, top)
+        for clause, scan, top in zip(parsed, scans, tops)
+    ]
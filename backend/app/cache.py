@@ -0,0 +1,114 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+
+# -------------------------
+# Result Cache
+# -------------------------
+
+class ResultCache:
+    """
+    Bounded LRU of JSON-serializable results keyed by content hash, with an
+    optional SQLite second tier that survives restarts.
+
+    Values are stored as JSON and decoded on every hit, so callers always
+    get a fresh object they are free to mutate. Rows written under other
+    versions are kept, since other processes may still be using them, until
+    purge() is called.
+    """
+
+    def __init__(self, maxsize: int = 2048, db_path: str | None = None, version: str = ""):
+        self.maxsize = maxsize
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.db_hits = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache "
+                "(key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Dict | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(value)
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM result_cache WHERE key = ? AND version = ?",
+                    (key, self.version),
+                ).fetchone()
+                if row is not None:
+                    self.db_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Dict):
+        self.put_many([(key, result)])
+
+    def put_many(self, items: list[tuple[str, Dict]]):
+        """Store several results with a single SQLite commit."""
+        rows = [(key, self.version, json.dumps(result)) for key, result in items]
+        if not rows:
+            return
+        with self._lock:
+            for key, _, value in rows:
+                self._remember(key, value)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO result_cache (key, version, value) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: str):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def purge(self) -> int:
+        """Delete SQLite rows written under any other version; returns how many."""
+        with self._lock:
+            if self._db is None:
+                return 0
+            deleted = self._db.execute("DELETE FROM result_cache WHERE version != ?", (self.version,)).rowcount
+            self._db.commit()
+            return deleted
+
+    def close(self):
+        """
+        Close the SQLite tier. The in-memory tier keeps working, so requests
+        still holding the cache finish without the second tier.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.db_hits = 0
+
+    def stats(self) -> Dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "version": self.version,
+        }
@@ -0,0 +1,317 @@
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from . import snapshot
+from .rules.catalog import IMPORTANT_TERMS, ImportantTerm, RULES, Rule
+from .rules.compiled import CatalogScanner, CompiledRuleSet
+
+
+# -------------------------
+# Catalog Sources
+# -------------------------
+
+# JSON file with any of "rules" (rules.catalog.Rule fields), "pattern_rules"
+# (extra.Rule fields) and "important_terms" (rules.catalog.ImportantTerm
+# fields); sections it leaves out keep the built-in catalogs. Unset, the
+# built-in catalogs are used and nothing can be reloaded.
+CATALOG_PATH = os.getenv("CLARISCAN_CATALOG_FILE") or None
+# Seconds between checks of the file for changes; 0 only reloads on request
+RELOAD_INTERVAL = float(os.getenv("CLARISCAN_CATALOG_RELOAD_INTERVAL", "0"))
+
+
+@dataclasses.dataclass(frozen=True)
+class CatalogSource:
+    """The rule definitions of every catalog, before compilation."""
+
+    rules: Tuple[Rule, ...]
+    pattern_rules: Tuple
+    important_terms: Tuple[ImportantTerm, ...]
+
+    @cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(repr(self).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def builtin_source() -> CatalogSource:
+    from . import extra
+    return CatalogSource(tuple(RULES), tuple(extra.RULES), tuple(IMPORTANT_TERMS))
+
+
+def read_source(path: "str | Path") -> CatalogSource:
+    """The catalogs defined in a JSON catalog file (see CATALOG_PATH)."""
+    from . import extra
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    builtin = builtin_source()
+
+    def section(name, cls, default):
+        if name not in data:
+            return default
+        return tuple(cls(**fields) for fields in data[name])
+
+    return CatalogSource(
+        rules=section("rules", Rule, builtin.rules),
+        pattern_rules=section("pattern_rules", extra.Rule, builtin.pattern_rules),
+        important_terms=section("important_terms", ImportantTerm, builtin.important_terms),
+    )
+
+
+def write_source(path: "str | Path", source: CatalogSource):
+    """Write every section of source as a JSON catalog file."""
+    data = {
+        name: [dataclasses.asdict(rule) for rule in getattr(source, name)]
+        for name in ("rules", "pattern_rules", "important_terms")
+    }
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+# -------------------------
+# Compiled Catalogs
+# -------------------------
+
+class Catalogs:
+    """
+    One version of every compiled catalog, never modified once built. A
+    reload compiles a new one and swaps it in whole; requests keep the
+    version they started with (see pinned).
+    """
+
+    __slots__ = ("version", "digest", "source", "path", "loaded_at", "analyzer", "extra", "terms", "engine", "scanner")
+
+    def __init__(self, version: int, source: CatalogSource, path: str | None, previous: "Catalogs | None" = None):
+        from . import analyzer, extra, terms
+        from .rules.engine import PatternMatcher
+
+        self.version = version
+        self.digest = source.digest
+        self.source = source
+        self.path = path
+        self.loaded_at = time.time()
+
+        # The snapshot holds the built-in catalogs, for the first compilation
+        if previous is None and self.digest == builtin_source().digest:
+            load = snapshot.load
+        else:
+            load = _build
+
+        # Catalogs whose rules did not change are shared with the previous
+        # version, along with their clause result cache
+        if previous is not None and previous.source.rules == source.rules:
+            self.analyzer = previous.analyzer
+        else:
+            self.analyzer = analyzer.RiskCatalog(load(
+                "analyzer",
+                lambda: CompiledRuleSet.from_keyword_rules(source.rules, negations=analyzer.NEGATIONS),
+            ))
+        if previous is not None and previous.source.pattern_rules == source.pattern_rules:
+            self.extra, self.engine = previous.extra, previous.engine
+        else:
+            compiled = load("extra", lambda: CompiledRuleSet.from_pattern_rules(source.pattern_rules))
+            self.extra = extra.PatternCatalog(compiled, load("extra.patterns", lambda: extra.literal_matcher(compiled)))
+            self.engine = PatternMatcher(entry.rule for entry in compiled.rules)
+        if previous is not None and previous.source.important_terms == source.important_terms:
+            self.terms = previous.terms
+        else:
+            self.terms = terms.TermCatalog(load(
+                "terms",
+                lambda: CompiledRuleSet.from_term_rules(source.important_terms),
+            ))
+        if previous is not None and self.analyzer is previous.analyzer and self.terms is previous.terms:
+            self.scanner = previous.scanner
+        else:
+            self.scanner = load(
+                "scanner",
+                lambda: CatalogScanner((self.analyzer.compiled, self.terms.compiled)),
+            )
+
+        # Automata are otherwise built by the first request needing them
+        self.analyzer.compiled.automaton
+        self.terms.compiled.automaton
+
+    def info(self) -> Dict:
+        return {
+            "version": self.version,
+            "digest": self.digest,
+            "path": self.path,
+            "loaded_at": self.loaded_at,
+            "rules": len(self.source.rules),
+            "pattern_rules": len(self.source.pattern_rules),
+            "important_terms": len(self.source.important_terms),
+        }
+
+
+def _build(name: str, build):
+    return build()
+
+
+# -------------------------
+# Current Version
+# -------------------------
+
+_latest: Catalogs | None = None
+# Serializes the first compilation and reloads; readers never take it
+_lock = threading.Lock()
+_pinned: ContextVar["Catalogs | None"] = ContextVar("catalogs", default=None)
+# Outcome of the last reload attempt, for GET /catalogs
+status = {"last_reload": None, "error": None}
+
+
+def latest() -> Catalogs:
+    """The newest compiled catalogs, compiling the initial ones on first use."""
+    if _latest is None:
+        _initialize()
+    return _latest
+
+
+def current() -> Catalogs:
+    """The catalogs pinned for the running request, or the newest ones."""
+    return _pinned.get() or latest()
+
+
+def _initialize():
+    global _latest
+    with _lock:
+        if _latest is None:
+            source = read_source(CATALOG_PATH) if CATALOG_PATH else builtin_source()
+            _latest = Catalogs(1, source, CATALOG_PATH)
+
+
+@contextmanager
+def pinned(catalogs: Catalogs | None = None):
+    """Make current() return these catalogs (by default the newest) until the block exits."""
+    token = _pinned.set(catalogs or latest())
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+_END = object()
+
+
+def pin_iter(items: Iterable) -> Iterator:
+    """
+    Iterate over items (e.g. a generator computing results lazily) with the
+    catalogs current at this call pinned around every step, however far
+    apart and on whichever thread the steps run.
+    """
+    # Captured here rather than on the first step, which may run much later
+    return _pinned_steps(current(), iter(items))
+
+
+def _pinned_steps(catalogs: Catalogs, items: Iterator) -> Iterator:
+    while True:
+        with pinned(catalogs):
+            item = next(items, _END)
+        if item is _END:
+            return
+        yield item
+
+
+def reload(path: str | None = None) -> Catalogs:
+    """
+    Compile the catalogs in path (by default CATALOG_PATH) and make them the
+    newest version, unless they are unchanged. Requests already running
+    finish on the version they started with. Raises ValueError when the
+    file cannot be read or compiled; the newest version is then kept.
+    """
+    global _latest
+    path = path or CATALOG_PATH
+    if path is None:
+        raise ValueError("No catalog file configured (CLARISCAN_CATALOG_FILE)")
+    latest()
+    with _lock:
+        status["last_reload"] = time.time()
+        try:
+            source = read_source(path)
+            if source.digest == _latest.digest:
+                status["error"] = None
+                return _latest
+            # Compiled while requests carry on with the previous version
+            catalogs = Catalogs(_latest.version + 1, source, str(path), previous=_latest)
+        except Exception as exc:
+            status["error"] = f"{path}: {exc!r}"
+            raise ValueError(status["error"]) from exc
+        status["error"] = None
+        # A single reference assignment: readers see one version or the other
+        previous, _latest = _latest, catalogs
+    _retire(previous, catalogs)
+    return catalogs
+
+
+def install(source: CatalogSource):
+    """
+    Make source the newest catalogs of this process (a pool worker, single
+    threaded), compiling it unless a forked worker inherited it.
+    """
+    global _latest
+    if _latest is None or _latest.digest != source.digest:
+        previous, _latest = _latest, Catalogs(_latest.version + 1 if _latest else 1, source, None, previous=_latest)
+        if previous is not None:
+            _retire(previous, _latest)
+
+
+def _retire(previous: Catalogs, catalogs: Catalogs):
+    # A replaced analyzer catalog's cache closes its SQLite connection;
+    # requests pinned to it carry on with its in-memory tier
+    if catalogs.analyzer is not previous.analyzer:
+        previous.analyzer.cache.close()
+
+
+# -------------------------
+# Catalog File Watcher
+# -------------------------
+
+_watcher: threading.Thread | None = None
+
+
+def watch(interval: float = RELOAD_INTERVAL):
+    """Reload CATALOG_PATH whenever it changes, checking every `interval` seconds."""
+    global _watcher
+    if _watcher is not None or not CATALOG_PATH or interval <= 0:
+        return
+    _watcher = threading.Thread(target=_watch, args=(interval,), name="clariscan-catalog-watcher", daemon=True)
+    _watcher.start()
+
+
+def _stamp():
+    try:
+        stat = os.stat(CATALOG_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _watch(interval: float):
+    seen = _stamp()
+    while True:
+        time.sleep(interval)
+        stamp = _stamp()
+        if stamp is None or stamp == seen:
+            continue
+        seen = stamp
+        try:
+            reload()
+        except ValueError:
+            # Recorded in status; the previous version stays in use
+            pass
+
+
+if __name__ == "__main__":
+    # python -m app.catalogs PATH: write the built-in catalogs as a catalog
+    # file to start editing from
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m app.catalogs PATH")
+    write_source(sys.argv[1], builtin_source())
+    print(f"Wrote {sys.argv[1]}")
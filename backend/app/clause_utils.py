@@ -1,4 +1,14 @@
 import re
+from typing import Iterable, Iterator
+
+
+# Pattern for numbered clauses like "1.", "2.", "3.1"
+CLAUSE_PATTERN = re.compile(
+    r"(?:^|\s)(\d+\.\s+)",
+    re.MULTILINE
+)
+
+MARKER_PATTERN = re.compile(r"\d+\.\s+")
 
 
 def split_into_clauses(text: str) -> list[str]:
@@ -10,34 +20,76 @@ def split_into_clauses(text: str) -> list[str]:
     if not text:
         return []
 
-    # Normalize whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    return list(iter_clauses([text]))
+
+
+def iter_clauses(chunks: Iterable[str]) -> Iterator[str]:
+    """Clauses of text arriving in chunks, each yielded as soon as it is complete."""
+    splitter = ClauseSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
 
-    # Pattern for numbered clauses like "1.", "2.", "3.1"
-    clause_pattern = re.compile(
-        r"(?:^|\s)(\d+\.\s+)",
-        re.MULTILINE
-    )
 
-    splits = clause_pattern.split(text)
+class ClauseSplitter:
+    """
+    Incremental split_into_clauses: feed the text in chunks (e.g. PDF
+    pages) and get back the clauses completed so far. The clauses returned
+    over all feed() calls and close() equal split_into_clauses of the
+    joined chunks.
+
+    A clause is complete once the next clause marker is followed by more
+    text: a marker at the very end of the text seen so far may still grow
+    ("1" + "2. ") or vanish when trailing whitespace is stripped.
+    """
+
+    def __init__(self):
+        self.pending = ""
+        self.started = False
+        self.current_clause = ""
 
-    clauses = []
-    current_clause = ""
+    def feed(self, chunk: str) -> list[str]:
+        # Normalize whitespace
+        chunk = re.sub(r"\s+", " ", chunk)
+        if not self.started:
+            chunk = chunk.lstrip()
+            self.started = bool(chunk)
+        if self.pending.endswith(" ") and chunk.startswith(" "):
+            chunk = chunk[1:]
+        self.pending += chunk
 
-    for part in splits:
-        if re.match(r"\d+\.\s+", part):
-            if current_clause:
-                clauses.append(current_clause.strip())
-            current_clause = part
-        else:
-            current_clause += " " + part
+        settled = None
+        for match in CLAUSE_PATTERN.finditer(self.pending):
+            if match.end() < len(self.pending):
+                settled = match
+        if settled is None:
+            return []
+        # Everything before the last settled marker is settled too
+        clauses = self._take(CLAUSE_PATTERN.split(self.pending[:settled.start()]))
+        self.pending = self.pending[settled.start():]
+        return clauses
 
-    if current_clause:
-        clauses.append(current_clause.strip())
+    def close(self) -> list[str]:
+        pending = self.pending.rstrip()
+        self.pending = ""
+        clauses = self._take(CLAUSE_PATTERN.split(pending)) if pending else []
+        if self.current_clause:
+            clauses.append(self.current_clause.strip())
+            self.current_clause = ""
+        return self._keep(clauses)
 
-    # Filter out very small fragments
-    cleaned_clauses = [
-        c for c in clauses if len(c) > 100
-    ]
+    def _take(self, splits: list[str]) -> list[str]:
+        clauses = []
+        for part in splits:
+            if MARKER_PATTERN.match(part):
+                if self.current_clause:
+                    clauses.append(self.current_clause.strip())
+                self.current_clause = part
+            else:
+                self.current_clause += " " + part
+        return self._keep(clauses)
 
-    return cleaned_clauses
+    @staticmethod
+    def _keep(clauses: list[str]) -> list[str]:
+        # Filter out very small fragments
+        return [c for c in clauses if len(c) > 100]
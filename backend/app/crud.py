@@ -1,10 +1,47 @@
+import json
+
 from sqlalchemy.orm import Session
 from . import models
 
 
-def create_document(db: Session, filename: str):
-    document = models.Document(filename=filename)
+def create_document(db: Session, filename: str, previous_version_id: int | None = None):
+    document = models.Document(filename=filename, previous_version_id=previous_version_id)
     db.add(document)
     db.commit()
     db.refresh(document)
     return document
+
+
+def get_document(db: Session, document_id: int):
+    return db.get(models.Document, document_id)
+
+
+def create_clauses(db: Session, document_id: int, clauses: list[str], analyses: list[dict], analysis_version: str):
+    db.add_all([
+        models.Clause(
+            document_id=document_id,
+            position=position,
+            clause_text=clause,
+            risk_level=analysis.get("risk_level"),
+            explanation=analysis.get("explanation"),
+            suggestion=analysis.get("suggestion"),
+            analysis=json.dumps(analysis),
+            analysis_version=analysis_version,
+        )
+        for position, (clause, analysis) in enumerate(zip(clauses, analyses))
+    ])
+    db.commit()
+
+
+def get_clause_analyses(db: Session, document_id: int, analysis_version: str) -> list[tuple[str, dict | None]]:
+    """(clause_text, analysis) in document order; analyses from another version are None."""
+    rows = (
+        db.query(models.Clause.clause_text, models.Clause.analysis, models.Clause.analysis_version)
+        .filter(models.Clause.document_id == document_id)
+        .order_by(models.Clause.position)
+        .all()
+    )
+    return [
+        (text, json.loads(analysis) if analysis and version == analysis_version else None)
+        for text, analysis, version in rows
+    ]
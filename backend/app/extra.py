@@ -1,8 +1,12 @@
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import List
 
+from . import catalogs, profiler
+from .rules.automaton import LiteralMatcher
+from .rules.compiled import CompiledRuleSet
+from .text_utils import NormalizedText
+
 """
 Deterministic rule catalog for ClariScan AI.
 
@@ -1563,18 +1567,67 @@ Rule("SAFETY_AUDITS", "safety_environment", "medium",
 ]
 
 
-def analyze_clause_with_rules(clause_text: str) -> dict:
+def literal_matcher(compiled: CompiledRuleSet) -> LiteralMatcher:
     """
-    Deterministically analyze a single clause against all rules.
+    Every lowercased pattern in one trie, owned by its pattern id (patterns
+    numbered in catalog order, see PatternCatalog.pattern_rules), so a
+    single pass over a text finds every pattern it contains.
     """
-    text = clause_text.lower()
-    matched = []
+    return LiteralMatcher(
+        (pattern, pid)
+        for pid, pattern in enumerate(
+            pattern for entry in compiled.rules for pattern in entry.patterns
+        )
+    )
 
-    for rule in RULES:
-        for pattern in rule.patterns:
-            if pattern.lower() in text:
-                matched.append(rule)
-                break
+
+class PatternCatalog:
+    """
+    One version of the pattern rules (see catalogs.Catalogs) and their
+    matcher. The patterns found in a text are kept on it
+    (NormalizedText.matches), where rules.engine reads them too.
+    """
+
+    __slots__ = ("compiled", "patterns", "pattern_rules")
+
+    def __init__(self, compiled: CompiledRuleSet, patterns: LiteralMatcher):
+        self.compiled = compiled
+        self.patterns = patterns
+        # Pattern id -> index of the rule owning it
+        self.pattern_rules = tuple(
+            i for i, entry in enumerate(compiled.rules) for _ in entry.patterns
+        )
+
+    def pattern_hits(self, text: NormalizedText) -> set:
+        """Ids of the patterns occurring in the lowercased text."""
+        hits = text.matches.get(self)
+        if hits is None:
+            hits = text.matches[self] = self.patterns.fired(text.lower)
+        return hits
+
+    def matched_rules(self, text: NormalizedText) -> list:
+        """Compiled rules with a pattern in the lowercased text, in catalog order."""
+        rules = self.compiled.rules
+        owners = self.pattern_rules
+        fired = {owners[pid] for pid in self.pattern_hits(text)}
+        if profiler.ENABLED:
+            self._profile(fired)
+        return [rules[i] for i in sorted(fired)]
+
+    def _profile(self, fired):
+        # The trie finds every rule in one pass, so there is no per-rule time
+        # to record: only that each rule was evaluated, and whether it hit
+        profiler.record("extra", [
+            (i, entry.rule.id, 0.0, i in fired, None)
+            for i, entry in enumerate(self.compiled.rules)
+        ])
+
+
+def analyze_clause_with_rules(clause_text: "str | NormalizedText") -> dict:
+    """
+    Deterministically analyze a single clause against all rules.
+    """
+    matched = catalogs.current().extra.matched_rules(NormalizedText.of(clause_text))
 
     if not matched:
         return {
@@ -1582,34 +1635,29 @@ def analyze_clause_with_rules(clause_text: str) -> dict:
             "risk_level": "Low",
             "summary": "Standard contractual language with no obvious risk.",
             "suggestion": None,
-            "matched_rules": []
+            "matched_rules": [],
         }
 
-    severity_rank = {"high": 3, "medium": 2, "low": 1}
-    highest = max(matched, key=lambda r: severity_rank[r.severity])
+    highest = max(matched, key=lambda e: e.risk_rank).rule
 
     return {
         "category": highest.category,
         "risk_level": highest.severity.capitalize(),
         "summary": highest.summary,
         "suggestion": highest.recommendation,
-        "matched_rules": [r.id for r in matched]
+        "matched_rules": [e.rule.id for e in matched],
     }
 
 
-def analyze_document_with_rules(full_text: str) -> dict:
+def analyze_document_with_rules(full_text: "str | NormalizedText") -> dict:
     """
     Extract high-signal, human-readable insights from the entire document.
     """
-    text = full_text.lower()
+    document = NormalizedText.of(full_text)
 
     buckets = defaultdict(list)
-
-    for rule in RULES:
-        for pattern in rule.patterns:
-            if pattern.lower() in text:
-                buckets[rule.category].append(rule)
-                break
+    for entry in catalogs.current().extra.matched_rules(document):
+        buckets[entry.rule.category].append(entry.rule)
 
     def unique_summaries(rules):
         seen = set()
@@ -1628,9 +1676,7 @@ def analyze_document_with_rules(full_text: str) -> dict:
         r.summary for r in buckets.get("review_required", [])
     ]
 
-    deadlines = []
-    for match in re.findall(r"\b\d+\s+(days|day|months|month|years|year)\b", text):
-        deadlines.append(match)
+    deadlines = list(document.numbers.deadlines)
 
     obligations = unique_summaries(
         buckets.get("critical_alert", []) +
@@ -1,12 +1,21 @@
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException
+import functools
+import hmac
+import io
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Literal
+
+from fastapi import FastAPI, UploadFile, File, Form, Query, Depends, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
-from .database import SessionLocal, engine
-from . import models, crud
-from .pdf_utils import extract_text_from_pdf
-from .clause_utils import split_into_clauses
-from .analyzer import analyze_clause, analyze_document
+# The database layer, the PDF reader and the rule catalogs are imported by
+# warm_up() rather than here, so the server answers "/" as soon as it starts
+# (see benchmarks/startup.py for the import time they take)
 
 # -------------------------
 # App initialization
@@ -20,7 +29,91 @@ app = FastAPI(
 
 @app.on_event("startup")
 def startup_event():
+    threading.Thread(target=warm_up, name="clariscan-warm-up", daemon=True).start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    from . import parallel
+    parallel.shutdown_pool()
+
+# -------------------------
+# Startup warm-up
+# -------------------------
+
+def _warm_database():
+    from .database import engine, add_missing_columns
+    from . import models
     models.Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+
+
+def _warm_catalogs():
+    # Loads (see snapshot) or compiles every catalog, and watches the
+    # catalog file for changes when configured
+    from . import catalogs, crud, revisions, streaming, unified  # noqa: F401
+    catalogs.latest()
+    catalogs.watch()
+
+
+def _warm_pdf():
+    from . import pdf_utils  # noqa: F401
+
+
+def _warm_pool():
+    from . import parallel
+    if parallel.parallel_enabled():
+        parallel.warm_up()
+
+
+_WARMUP_STEPS = (
+    ("database", _warm_database),
+    ("catalogs", _warm_catalogs),
+    ("pdf", _warm_pdf),
+    ("pool", _warm_pool),
+)
+
+_warmup_lock = threading.Lock()
+_ready = threading.Event()
+# Seconds taken by each completed step, and the error of the last failed run
+_warmup = {"seconds": {}, "error": None}
+
+
+def warm_up():
+    """
+    Run the startup steps once. The startup event runs them in a background
+    thread; requests arriving earlier wait for them here, and a failed
+    warm-up is retried by the next call.
+    """
+    if _ready.is_set():
+        return
+    with _warmup_lock:
+        if _ready.is_set():
+            return
+        _warmup["error"] = None
+        for name, step in _WARMUP_STEPS:
+            start = time.perf_counter()
+            try:
+                step()
+            except Exception as exc:
+                _warmup["error"] = f"{name}: {exc!r}"
+                raise
+            _warmup["seconds"][name] = round(time.perf_counter() - start, 4)
+        _ready.set()
+
+
+def _pin_catalogs(handler):
+    """
+    Run the handler with the catalogs current when the request starts
+    (catalogs.pinned), whatever reloads happen while it runs.
+    """
+    @functools.wraps(handler)
+    def pinned_handler(*args, **kwargs):
+        warm_up()
+        from . import catalogs
+        with catalogs.pinned():
+            return handler(*args, **kwargs)
+    return pinned_handler
 
 # -------------------------
 # CORS configuration
@@ -39,12 +132,30 @@ app.add_middleware(
 # -------------------------
 
 def get_db():
+    warm_up()
+    from .database import SessionLocal
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+# -------------------------
+# Admin authorization
+# -------------------------
+
+# Token required by the endpoints that change server state (catalog
+# reload, cache purge, profile reset), sent as the X-Admin-Token header.
+# Unset, those endpoints are disabled.
+ADMIN_TOKEN = os.getenv("CLARISCAN_ADMIN_TOKEN") or None
+
+
+def require_admin(x_admin_token: str | None = Header(None)):
+    if ADMIN_TOKEN is None:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (CLARISCAN_ADMIN_TOKEN is not set).")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=401, detail="Missing or invalid X-Admin-Token header.")
+
 # -------------------------
 # Health check
 # -------------------------
@@ -57,15 +168,41 @@ def health_check():
         "engine": "deterministic-rule-engine"
     }
 
+
+@app.get("/ready")
+def readiness_check(response: Response):
+    """
+    200 once the database is set up and the catalogs are loaded, 503 until
+    then; either way with the time each warm-up step took.
+    """
+    from . import snapshot
+
+    ready = _ready.is_set()
+    if not ready:
+        response.status_code = 503
+    return {
+        "status": "ready" if ready else "warming_up",
+        "warmup_seconds": dict(_warmup["seconds"]),
+        "catalog_snapshot": snapshot.loaded(),
+        "error": _warmup["error"],
+    }
+
 # -------------------------
 # Analyze contract endpoint
 # -------------------------
 
 @app.post("/analyze")
+@_pin_catalogs
 def analyze_contract(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    previous_document_id: int | None = Form(None),
+    db: "Session" = Depends(get_db)
 ):
+    from . import catalogs, crud, parallel, revisions, terms
+    from .clause_utils import split_into_clauses
+    from .pdf_utils import extract_text_from_pdf
+    from .text_utils import NormalizedText
+
     # 1. Extract full text from file (PDF or text)
     filename = file.filename.lower()
 
@@ -81,32 +218,226 @@ def analyze_contract(
             detail="Uploaded file contains insufficient text for analysis."
         )
 
-    # 2. Run document-level intelligence engine
-    document_summary = analyze_document(document_text)
-
-    # 3. Split into clauses (for UI drill-down)
+    # 2. Split into clauses (for UI drill-down)
     clauses = split_into_clauses(document_text)
 
-    # 4. Persist document metadata
+    # 3. Run clause- and document-level engines and the important-terms
+    #    extractor over one shared keyword scan; a revision only re-analyzes
+    #    clauses that changed since the previous version
+    document = NormalizedText(document_text)
+    catalogs.current().scanner.scan(document)
+    analysis_version = revisions.stored_analysis_version()
+    if previous_document_id is not None:
+        if crud.get_document(db, previous_document_id) is None:
+            raise HTTPException(status_code=404, detail="Previous document not found.")
+        previous = crud.get_clause_analyses(db, previous_document_id, analysis_version)
+        analysis = revisions.analyze_revision(clauses, document, previous)
+    else:
+        analysis = parallel.analyze_clauses(clauses, document)
+    document_summary = analysis["document_summary"]
+    important_terms = terms.extract_important_terms(document)
+
+    # 4. Persist document metadata and clause results for later revisions
     document = crud.create_document(
         db=db,
-        filename=file.filename
+        filename=file.filename,
+        previous_version_id=previous_document_id
     )
+    crud.create_clauses(db, document.id, clauses, analysis["clauses"], analysis_version)
 
     # 5. Clause-level results
     clause_results = [
         {
             "clause_text": clause,
-            "analysis": analyze_clause(clause)
+            "analysis": clause_analysis
         }
-        for clause in clauses
+        for clause, clause_analysis in zip(clauses, analysis["clauses"])
     ]
 
     # 6. Final response
-    return {
+    response = {
         "document_id": document.id,
         "filename": file.filename,
         "total_clauses": len(clause_results),
         "document_summary": document_summary,
+        "important_terms": important_terms,
         "clauses": clause_results
     }
+    if previous_document_id is not None:
+        response["previous_document_id"] = previous_document_id
+        response["revision"] = analysis["revision"]
+    return response
+
+# -------------------------
+# Top finding endpoint
+# -------------------------
+
+@app.post("/analyze/top")
+@_pin_catalogs
+def analyze_contract_top(file: UploadFile = File(...)):
+    """
+    Only the headline finding of each clause, for clients that render
+    nothing else. Nothing is stored and no document summary is computed.
+    """
+    from . import analyzer
+    from .clause_utils import split_into_clauses
+    from .pdf_utils import extract_text_from_pdf
+
+    filename = file.filename.lower()
+
+    if filename.endswith(".pdf"):
+        document_text = extract_text_from_pdf(file.file)
+    else:
+        document_text = file.file.read().decode("utf-8", errors="ignore")
+
+    if not document_text or len(document_text.strip()) < 20:
+        raise HTTPException(
+            status_code=400,
+            detail="Uploaded file contains insufficient text for analysis."
+        )
+
+    clauses = split_into_clauses(document_text)
+    return {
+        "filename": file.filename,
+        "total_clauses": len(clauses),
+        "clauses": [
+            {
+                "clause_text": clause,
+                "analysis": analyzer.analyze_clause_top(clause)
+            }
+            for clause in clauses
+        ]
+    }
+
+# -------------------------
+# Streaming analyze endpoint
+# -------------------------
+
+@app.post("/analyze/stream")
+@_pin_catalogs
+def analyze_contract_stream(
+    file: UploadFile = File(...),
+    fmt: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+    db: "Session" = Depends(get_db)
+):
+    """
+    Same analysis as /analyze, streamed as NDJSON lines or Server-Sent
+    Events: the document id first, then the summary and each clause result
+    as soon as they are computed. PDF pages are read one at a time.
+    """
+    from . import catalogs, crud, streaming
+    from .pdf_utils import iter_pdf_pages
+
+    filename = file.filename.lower()
+
+    # The upload is read before streaming starts; the pages are parsed lazily
+    if filename.endswith(".pdf"):
+        chunks = iter_pdf_pages(io.BytesIO(file.file.read()))
+    else:
+        chunks = [file.file.read().decode("utf-8", errors="ignore")]
+
+    enough_text, chunks = streaming.peek_text(chunks)
+    if not enough_text:
+        raise HTTPException(
+            status_code=400,
+            detail="Uploaded file contains insufficient text for analysis."
+        )
+
+    document = crud.create_document(
+        db=db,
+        filename=file.filename
+    )
+    # Computed while the response streams, after this handler has returned
+    events = catalogs.pin_iter(streaming.iter_analysis(chunks, document.id, file.filename))
+    return StreamingResponse(
+        (streaming.frame(event, fmt) for event in events),
+        media_type=streaming.MEDIA_TYPES[fmt],
+    )
+
+# -------------------------
+# Rule catalogs
+# -------------------------
+
+@app.get("/catalogs")
+def catalog_version():
+    """
+    The catalog version new requests are analyzed with, the outcome of the
+    last reload, and the hit and miss counts of that version's clause
+    result cache.
+    """
+    warm_up()
+    from . import catalogs
+
+    current = catalogs.latest()
+    return {
+        "current": current.info(),
+        "last_reload": catalogs.status["last_reload"],
+        "reload_error": catalogs.status["error"],
+        "clause_cache": current.analyzer.cache.stats(),
+    }
+
+
+@app.post("/catalogs/reload", dependencies=[Depends(require_admin)])
+def reload_catalogs():
+    """
+    Recompile the catalog file (CLARISCAN_CATALOG_FILE) and switch new
+    requests to it; requests already running finish on the previous version.
+    Admin only (see require_admin).
+    """
+    warm_up()
+    from . import catalogs
+
+    try:
+        current = catalogs.reload()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"current": current.info()}
+
+
+@app.delete("/catalogs/clause-cache", dependencies=[Depends(require_admin)])
+def purge_clause_cache():
+    """
+    Delete clause results that earlier catalog versions stored in the
+    SQLite cache (CLARISCAN_CLAUSE_CACHE_DB). Only call it once no process
+    is analyzing with those versions any more. Admin only.
+    """
+    warm_up()
+    from . import catalogs
+
+    return {"purged": catalogs.latest().analyzer.cache.purge()}
+
+# -------------------------
+# Rule profiler
+# -------------------------
+
+@app.get("/profile/rules")
+def rule_profile(
+    engine: Literal["analyzer", "extra"] | None = None,
+    sort: Literal["seconds", "avg_seconds", "evaluations", "hits", "hit_rate"] = "seconds",
+    limit: int = Query(50, ge=0),
+):
+    """
+    Per-rule evaluation count, cumulative time, hit count and average
+    confidence since startup or the last reset, most costly first (limit 0
+    for every rule). Only recorded with CLARISCAN_RULE_PROFILE=1, and not
+    for clauses analyzed in the process pool. Extra's rules are found by a
+    single trie pass, so their seconds are null (listed in "untimed").
+    """
+    warm_up()
+    from . import profiler
+
+    rows = profiler.report(sort, engine)
+    return {
+        "enabled": profiler.ENABLED,
+        "untimed": [name for name in profiler.ENGINES if name not in profiler.TIMED_ENGINES],
+        "rules": rows[:limit] if limit else rows,
+    }
+
+
+@app.delete("/profile/rules", dependencies=[Depends(require_admin)])
+def reset_rule_profile():
+    """Forget every recorded rule evaluation. Admin only (see require_admin)."""
+    from . import profiler
+
+    profiler.reset()
+    return {"reset": True}
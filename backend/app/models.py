@@ -10,11 +10,14 @@ class Document(Base):
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
+    # Set when this document was uploaded as a revision of another one
+    previous_version_id = Column(Integer, ForeignKey("documents.id"), nullable=True)
 
     clauses = relationship(
         "Clause",
         back_populates="document",
-        cascade="all, delete"
+        cascade="all, delete",
+        order_by="Clause.position"
     )
 
 
@@ -22,11 +25,16 @@ class Clause(Base):
     __tablename__ = "clauses"
 
     id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"))
+    document_id = Column(Integer, ForeignKey("documents.id"), index=True)
+    position = Column(Integer)
 
     clause_text = Column(Text, nullable=False)
     risk_level = Column(String)
     explanation = Column(Text)
     suggestion = Column(Text)
 
+    # Full analyzer result as JSON, reused when a revision keeps the clause
+    analysis = Column(Text)
+    analysis_version = Column(String)
+
     document = relationship("Document", back_populates="clauses")
@@ -0,0 +1,206 @@
+import re
+
+
+# -------------------------
+# Numeric Patterns
+# -------------------------
+
+# Patterns for numbers written as digits or words (up to 99)
+NUM_WORDS = {
+    "one":1, "two":2, "three":3, "four":4, "five":5, "six":6, "seven":7, "eight":8, "nine":9,
+    "ten":10, "eleven":11, "twelve":12, "thirteen":13, "fourteen":14, "fifteen":15,
+    "sixteen":16, "seventeen":17, "eighteen":18, "nineteen":19, "twenty":20,
+    "thirty":30, "forty":40, "fifty":50, "sixty":60, "seventy":70, "eighty":80, "ninety":90
+}
+
+# Regex to capture time expressions like "3 years", "three (3) years", "90-day cure period", "within 48 hrs"
+TIME_UNITS = {
+    "years": r"years?|yrs?|y",
+    "months": r"months?|mos?|mth",
+    "weeks": r"weeks?|wks?|w",
+    "days": r"days?|d",
+    "hours": r"hours?|hrs?|h",
+}
+
+# Build a combined regex pattern to match numbers and units
+# Capture number (word or digit), optional parenthetical number, then unit
+TIME_PATTERN = re.compile(
+    r"\b(?P<num_word>\w+)?\s*(\(?\s*(?P<num_digit>\d+)\s*\))?\s*(?P<unit>" +
+    "|".join(TIME_UNITS.values()) +
+    r")\b",
+    re.IGNORECASE
+)
+
+
+def _unit_spellings(pattern: str) -> list[str]:
+    # "years?|yrs?|y" -> year, years, yr, yrs, y
+    spellings = []
+    for alt in pattern.split("|"):
+        if alt.endswith("?"):
+            spellings.append(alt[:-2])
+            alt = alt[:-1]
+        spellings.append(alt)
+    return spellings
+
+
+# Casefolded unit spelling -> TIME_UNITS key; casefolding agrees with
+# IGNORECASE on every letter these spellings use (including "ſ" for "s")
+TIME_UNIT_NAMES = {
+    spelling: key
+    for key, pattern in TIME_UNITS.items()
+    for spelling in _unit_spellings(pattern)
+}
+
+PERCENT_PATTERN = re.compile(
+    r"(?P<value>\d+(?:\.\d+)?)\s*%"
+)
+
+NUMBER_PATTERN = re.compile(r"\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b")
+
+# Matched against lowercased text
+DEADLINE_PATTERN = re.compile(r"\b\d+\s+(days|day|months|month|years|year)\b")
+
+# Where any of the patterns above can start: digit runs and number words
+# (the lookahead on first letters keeps the word alternation off most positions)
+_ANCHOR = re.compile(
+    r"\d+|\b(?=[" + "".join(sorted({word[0] for word in NUM_WORDS})) + r"])(?:" + "|".join(NUM_WORDS) + r")",
+    re.IGNORECASE,
+)
+
+# A number can only be the parenthesised part of a time expression that
+# starts before it when a ")" follows
+_CLOSE_PAREN = re.compile(r"\s*\)")
+
+
+def _is_word(char: str) -> bool:
+    # Same character class as \w
+    return char.isalnum() or char == "_"
+
+
+# -------------------------
+# Numeric Scan
+# -------------------------
+
+class NumericScan:
+    """
+    Time, percentage, plain-number and deadline matches in one text, in
+    text order. Each list holds exactly what finditer/findall of the
+    corresponding pattern would return.
+    """
+
+    __slots__ = ("times", "percents", "numbers", "deadlines")
+
+    def __init__(self, times: list, percents: list, numbers: list, deadlines: list[str]):
+        self.times = times
+        self.percents = percents
+        self.numbers = numbers
+        self.deadlines = deadlines
+
+
+def scan_numbers(text: str, lower: str | None = None) -> NumericScan:
+    """
+    Find every numeric entity with one pass over the text.
+
+    Every pattern match starts at a digit run or a number word, or at the
+    word just before a parenthesised number ("within (30) days"), so only
+    those positions are tried, with each pattern resuming where its
+    previous match ended exactly as finditer does.
+    """
+    if lower is None:
+        lower = text.lower()
+    # Deadlines are matched on the lowercased text; offsets are shared with
+    # `text` unless lowercasing changed its length
+    aligned = len(lower) == len(text)
+
+    times, percents, numbers, deadlines = [], [], [], []
+    time_end = percent_end = number_end = deadline_end = 0
+
+    def try_time(pos: int):
+        nonlocal time_end
+        if pos >= time_end:
+            m = TIME_PATTERN.match(text, pos)
+            if m:
+                times.append(m)
+                time_end = m.end()
+
+    for anchor in _ANCHOR.finditer(text):
+        start = anchor.start()
+        if not text[start].isdigit():
+            try_time(start)
+            continue
+
+        if _CLOSE_PAREN.match(text, anchor.end()):
+            for pos, skip in _time_starts(text, start):
+                if skip:
+                    # Word swallowed by an unmatched "<word> <unit>" expression
+                    time_end = max(time_end, pos)
+                else:
+                    try_time(pos)
+        else:
+            try_time(start)
+
+        if start >= percent_end:
+            m = PERCENT_PATTERN.match(text, start)
+            if m:
+                percents.append(m)
+                percent_end = m.end()
+        if start >= number_end:
+            m = NUMBER_PATTERN.match(text, start)
+            if m:
+                numbers.append(m)
+                number_end = m.end()
+        if aligned and start >= deadline_end:
+            m = DEADLINE_PATTERN.match(lower, start)
+            if m:
+                deadlines.append(m.group(1))
+                deadline_end = m.end()
+
+    if not aligned:
+        deadlines = DEADLINE_PATTERN.findall(lower)
+    return NumericScan(times, percents, numbers, deadlines)
+
+
+def _time_starts(text: str, digit: int) -> list[tuple[int, bool]]:
+    """
+    Positions at which a TIME_PATTERN match using the digit run at `digit`,
+    followed by ")", can start, in text order, each as (pos, skip). With
+    skip set, pos is the end of a preceding word that cannot start a match
+    because an earlier "<word> <unit>" match always covers it; the scan
+    resumes at pos instead.
+    """
+    word_start = digit
+    while word_start > 0 and _is_word(text[word_start - 1]):
+        word_start -= 1
+    if word_start < digit:
+        # "a12) days": the number sits inside a word
+        return [(word_start, False)]
+
+    # The previous word, if only "\s*\(?\s*" separates it from the number
+    pos = digit
+    while pos > 0 and text[pos - 1].isspace():
+        pos -= 1
+    if pos > 0 and text[pos - 1] == "(":
+        pos -= 1
+        while pos > 0 and text[pos - 1].isspace():
+            pos -= 1
+    if pos == digit or pos == 0 or not _is_word(text[pos - 1]):
+        return [(digit, False)]
+
+    word_end = pos
+    prev_start = word_end - 1
+    while prev_start > 0 and _is_word(text[prev_start - 1]):
+        prev_start -= 1
+
+    first = (prev_start, False)
+    if text[prev_start:word_end].casefold() in TIME_UNIT_NAMES and _unit_covered(text, prev_start):
+        first = (word_end, True)
+    return [first, (word_end, False), (digit, False)]
+
+
+def _unit_covered(text: str, word_start: int) -> bool:
+    # A unit word after "<word><spaces>" is always consumed by a match
+    # starting at or before that word's end
+    pos = word_start
+    while pos > 0 and text[pos - 1].isspace():
+        pos -= 1
+    return pos < word_start and pos > 0 and _is_word(text[pos - 1])
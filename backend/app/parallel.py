@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict
+
+from . import analyzer, catalogs
+from .text_utils import NormalizedText
+
+
+# -------------------------
+# Parallel Clause Analysis (opt-in)
+# -------------------------
+
+# 0 keeps every request single-process (the default)
+PARALLEL_WORKERS = int(os.getenv("CLARISCAN_PARALLEL_WORKERS", "0"))
+# Documents with fewer clauses than this are not worth the IPC overhead
+PARALLEL_MIN_CLAUSES = int(os.getenv("CLARISCAN_PARALLEL_MIN_CLAUSES", "100"))
+# Batches handed to each worker per document, to even out uneven clauses
+BATCHES_PER_WORKER = 4
+
+_pool: ProcessPoolExecutor | None = None
+# Digest of the catalogs the pool's workers analyze with
+_pool_digest: str | None = None
+_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    # Not fork: the pool starts from a request thread while other threads
+    # run, and a forked worker would inherit their held locks and the clause
+    # cache's SQLite connection. The fork server is a clean single-threaded
+    # process with this module already imported.
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _warm_worker(source: catalogs.CatalogSource):
+    # Workers analyze with the catalogs the pool was started for, loaded or
+    # compiled once here. Their clause caches stay in memory: results are
+    # stored by the parent, in its own SQLite tier.
+    analyzer.CLAUSE_CACHE_DB = None
+    catalogs.install(source)
+
+
+def _analyze_batch(clauses: list[str], proximity_window: int) -> list[Dict]:
+    return analyzer.analyze_clause_batch(clauses, proximity_window)
+
+
+def _worker_catalogs() -> str:
+    # Digest of the catalogs a worker analyzes with
+    return catalogs.latest().digest
+
+
+def parallel_enabled() -> bool:
+    return PARALLEL_WORKERS > 0
+
+
+def get_pool() -> ProcessPoolExecutor | None:
+    """
+    The process pool for this server worker, started on first use and
+    restarted for the new catalogs after a reload. None for a request still
+    running on catalogs that have since been replaced.
+    """
+    with _pool_lock:
+        return _current_pool()
+
+
+def _current_pool() -> ProcessPoolExecutor | None:
+    global _pool, _pool_digest
+    current = catalogs.current()
+    if current.digest != _pool_digest:
+        if current is not catalogs.latest():
+            return None
+        if _pool is not None:
+            # Batches already submitted finish on the old workers
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(
+            max_workers=PARALLEL_WORKERS,
+            mp_context=_pool_context(),
+            initializer=_warm_worker,
+            initargs=(current.source,),
+        )
+        _pool_digest = current.digest
+    return _pool
+
+
+def _submit(batches: list[list[str]], proximity_window: int) -> list[Future] | None:
+    # Under the lock, so that a reload cannot shut the pool down mid-way
+    with _pool_lock:
+        pool = _current_pool()
+        if pool is None:
+            return None
+        return [pool.submit(_analyze_batch, batch, proximity_window) for batch in batches]
+
+
+def warm_up():
+    """
+    Start the pool for the newest catalogs and wait for a worker to load
+    them. Raises RuntimeError if it loaded others, or BrokenProcessPool if
+    it could not start.
+    """
+    latest = catalogs.latest()
+    with catalogs.pinned(latest):
+        pool = get_pool()
+    loaded = pool.submit(_worker_catalogs).result()
+    if loaded != latest.digest:
+        raise RuntimeError(f"Pool worker loaded catalogs {loaded}, expected {latest.digest}")
+
+
+def shutdown_pool():
+    global _pool, _pool_digest
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = _pool_digest = None
+
+
+def analyze_clauses(
+    clauses: list[str],
+    document_text: "str | NormalizedText | None" = None,
+    proximity_window: int = analyzer.PROXIMITY_WINDOW,
+) -> Dict:
+    """
+    Same result as analyzer.analyze_clauses. When parallel mode is enabled
+    and the document has at least PARALLEL_MIN_CLAUSES clauses, clause
+    batches are analyzed in the process pool while this process builds the
+    document summary; results are merged back in clause order.
+    """
+    if not parallel_enabled() or len(clauses) < PARALLEL_MIN_CLAUSES:
+        return analyzer.analyze_clauses(clauses, document_text, proximity_window)
+
+    if document_text is None:
+        document_text = " ".join(clauses)
+
+    # Cache keys, pool workers and the summary all use one catalog version
+    with catalogs.pinned(catalogs.current()):
+        return _analyze_in_pool(clauses, document_text, proximity_window)
+
+
+def _analyze_in_pool(clauses: list[str], document_text: "str | NormalizedText", proximity_window: int) -> Dict:
+    # Cached clauses are answered here; only misses travel to the pool
+    catalog = catalogs.current().analyzer
+    parsed = [NormalizedText.of(c) for c in clauses]
+    keys, results = analyzer._cached_clauses(catalog, parsed, proximity_window)
+    missing = [i for i, result in enumerate(results) if result is None]
+    pending = [parsed[i].text for i in missing]
+
+    batch_size = max(1, -(-len(pending) // (PARALLEL_WORKERS * BATCHES_PER_WORKER)))
+    futures = _submit(
+        [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)],
+        proximity_window,
+    )
+    if futures is None:
+        return analyzer.analyze_clauses(clauses, document_text, proximity_window)
+
+    document_summary = analyzer.analyze_document(document_text, proximity_window)
+
+    fresh = [result for future in futures for result in future.result()]
+    analyzer._store_clauses(catalog, keys, results, missing, fresh)
+    return {
+        "clauses": results,
+        "document_summary": document_summary,
+    }
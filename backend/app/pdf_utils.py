@@ -1,13 +1,36 @@
+from typing import Iterator
+
 from pypdf import PdfReader
 
 
 def extract_text_from_pdf(file) -> str:
+    return "".join(iter_pdf_pages(file))
+
+
+def iter_pdf_pages(file) -> Iterator[str]:
+    """
+    Yield the text of each page as soon as it is extracted. The pages join
+    to exactly the stripped text extract_text_from_pdf returns, so
+    whitespace-only pages at either end are held back or dropped.
+    """
     reader = PdfReader(file)
-    text = ""
+    held = ""
 
     for page in reader.pages:
         page_text = page.extract_text()
-        if page_text:
-            text += page_text + "\n"
+        if not page_text:
+            continue
+        page_text += "\n"
+        if not held:
+            page_text = page_text.lstrip()
+            if not page_text:
+                continue
+        if page_text.strip():
+            if held:
+                yield held
+            held = page_text
+        else:
+            held += page_text
 
-    return text.strip()
+    if held:
+        yield held.rstrip()
@@ -0,0 +1,168 @@
+import argparse
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+
+# -------------------------
+# Per-Rule Profiler
+# -------------------------
+
+# Off by default; when on, the engines record every rule they evaluate
+ENABLED = os.getenv("CLARISCAN_RULE_PROFILE", "0") == "1"
+
+ENGINES = ("analyzer", "extra")
+# Engines timing each rule (analyzer: proximity scoring of each candidate
+# rule). Extra's single trie pass cannot be split by rule, so its rows only
+# count evaluations and hits, with no seconds.
+TIMED_ENGINES = ("analyzer",)
+SORT_KEYS = ("seconds", "avg_seconds", "evaluations", "hits", "hit_rate")
+
+
+class RuleStats:
+    """Counters for one rule of one engine's catalog."""
+
+    __slots__ = ("evaluations", "seconds", "hits", "confidence_total", "confidence_count")
+
+    def __init__(self):
+        self.evaluations = 0
+        self.seconds = 0.0
+        self.hits = 0
+        self.confidence_total = 0
+        self.confidence_count = 0
+
+
+# (engine, index in the catalog, rule id) -> counters; ids alone are not
+# unique in every catalog
+_stats: Dict[Tuple[str, int, str], RuleStats] = {}
+_lock = threading.Lock()
+
+
+def record(engine: str, samples: Iterable[tuple]):
+    """
+    Record rule evaluations, each (index, rule_id, seconds, hit, confidence);
+    confidence is None for engines without one.
+    """
+    with _lock:
+        for index, rule_id, seconds, hit, confidence in samples:
+            stats = _stats.get((engine, index, rule_id))
+            if stats is None:
+                stats = _stats[(engine, index, rule_id)] = RuleStats()
+            stats.evaluations += 1
+            stats.seconds += seconds
+            if hit:
+                stats.hits += 1
+                if confidence is not None:
+                    stats.confidence_total += confidence
+                    stats.confidence_count += 1
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def _catalog_rules(engine: str):
+    from . import catalogs
+
+    current = catalogs.latest()
+    compiled = current.analyzer.compiled if engine == "analyzer" else current.extra.compiled
+    return [entry.rule for entry in compiled.rules]
+
+
+def report(sort: str = "seconds", engine: str | None = None) -> List[Dict]:
+    """
+    One row per rule of the current catalogs, most costly first (or by
+    `sort`, descending). Rules never evaluated are included with zero
+    counts, so rules that never fire show up whether or not the keyword
+    index ever let them be scored. Seconds are None for engines that are
+    not timed (see TIMED_ENGINES); those rows sort last by time.
+    """
+    with _lock:
+        counters = {key: (s.evaluations, s.seconds, s.hits, s.confidence_total, s.confidence_count)
+                    for key, s in _stats.items()}
+    rows = []
+    for name in ENGINES if engine is None else (engine,):
+        timed = name in TIMED_ENGINES
+        for index, rule in enumerate(_catalog_rules(name)):
+            evaluations, seconds, hits, conf_total, conf_count = counters.get(
+                (name, index, rule.id), (0, 0.0, 0, 0, 0)
+            )
+            rows.append({
+                "engine": name,
+                "index": index,
+                "rule_id": rule.id,
+                "evaluations": evaluations,
+                "seconds": seconds if timed else None,
+                "avg_seconds": (seconds / evaluations if evaluations else 0.0) if timed else None,
+                "hits": hits,
+                "hit_rate": hits / evaluations if evaluations else 0.0,
+                "avg_confidence": conf_total / conf_count if conf_count else None,
+            })
+    rows.sort(key=lambda row: (row[sort] is not None, row[sort] or 0), reverse=True)
+    return rows
+
+
+# -------------------------
+# CLI Report
+# -------------------------
+
+def _read_document(path: Path) -> str:
+    if path.suffix.lower() == ".pdf":
+        from .pdf_utils import extract_text_from_pdf
+        with open(path, "rb") as f:
+            return extract_text_from_pdf(f)
+    return path.read_text(encoding="utf-8", errors="ignore")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run every engine over documents and report per-rule cost and hit rate."
+    )
+    parser.add_argument("documents", nargs="+", type=Path, help="text or PDF files")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="seconds")
+    parser.add_argument("--engine", choices=ENGINES)
+    parser.add_argument("--limit", type=int, default=25, help="rows to print (0 for all)")
+    parser.add_argument("--json", type=Path, help="also write every row here")
+    args = parser.parse_args()
+
+    # The module the engines check, not __main__ under `python -m`
+    from . import profiler, unified
+
+    profiler.ENABLED = True
+    for path in args.documents:
+        unified.analyze_all(_read_document(path))
+    rows = profiler.report(args.sort, args.engine)
+
+    total = sum(row["seconds"] or 0.0 for row in rows) or 1.0
+    shown = rows[:args.limit] if args.limit else rows
+    print(f"{len(args.documents)} documents, sorted by {args.sort}")
+    print(f"{'engine':<9} {'rule':<34} {'evals':>7} {'ms':>9} {'share':>6} {'us/eval':>8} {'hits':>6} {'rate':>6} {'conf':>5}")
+    for row in shown:
+        conf = "-" if row["avg_confidence"] is None else f"{row['avg_confidence']:.0f}"
+        if row["seconds"] is None:
+            ms, share, per_eval = "-", "-", "-"
+        else:
+            ms = f"{row['seconds'] * 1000:.2f}"
+            share = f"{row['seconds'] / total:.1%}"
+            per_eval = f"{row['avg_seconds'] * 1e6:.1f}"
+        print(
+            f"{row['engine']:<9} {row['rule_id'][:34]:<34} {row['evaluations']:>7} "
+            f"{ms:>9} {share:>6} {per_eval:>8} {row['hits']:>6} {row['hit_rate']:>6.1%} {conf:>5}"
+        )
+    if args.engine != "analyzer":
+        print("extra is not timed per rule (one trie pass); its ms columns are '-'")
+    dead = [row for row in rows if row["hits"] == 0]
+    print(f"\nnever fired: {len(dead)} of {len(rows)} rules")
+    for name in ENGINES:
+        ids = [row["rule_id"] for row in dead if row["engine"] == name]
+        if ids:
+            print(f"  {name}: {', '.join(ids)}")
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
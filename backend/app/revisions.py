@@ -0,0 +1,65 @@
+from difflib import SequenceMatcher
+from typing import Dict
+
+from . import catalogs, parallel
+from .text_utils import NormalizedText
+
+
+# -------------------------
+# Incremental Re-analysis
+# -------------------------
+
+def diff_clauses(previous: list[str], clauses: list[str]) -> Dict:
+    """Clause-level diff of two versions of a document, counted by kind."""
+    counts = {"unchanged": 0, "changed": 0, "added": 0, "removed": 0}
+    matcher = SequenceMatcher(a=previous, b=clauses, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        old, new = i2 - i1, j2 - j1
+        if tag == "equal":
+            counts["unchanged"] += new
+        elif tag == "replace":
+            counts["changed"] += min(old, new)
+            counts["added"] += max(0, new - old)
+            counts["removed"] += max(0, old - new)
+        elif tag == "insert":
+            counts["added"] += new
+        elif tag == "delete":
+            counts["removed"] += old
+    return counts
+
+
+def analyze_revision(
+    clauses: list[str],
+    document_text: "str | NormalizedText",
+    previous: list[tuple[str, Dict | None]],
+) -> Dict:
+    """
+    Analyze a new version of a document given the (clause_text, analysis)
+    pairs stored for the previous version.
+
+    Clause analysis depends only on the clause text, so every clause whose
+    text is unchanged reuses its stored result and only added or edited
+    clauses are analyzed. The document summary is recomputed from one scan
+    of the new text: rules can match across clause boundaries and in text
+    between clauses, so it cannot be patched from per-clause results.
+    """
+    stored = {text: analysis for text, analysis in previous if analysis is not None}
+    pending = [i for i, clause in enumerate(clauses) if clause not in stored]
+
+    analysis = parallel.analyze_clauses([clauses[i] for i in pending], document_text)
+    results = [stored.get(clause) for clause in clauses]
+    for i, result in zip(pending, analysis["clauses"]):
+        results[i] = result
+
+    revision = diff_clauses([text for text, _ in previous], clauses)
+    revision["reanalyzed"] = len(pending)
+    return {
+        "clauses": results,
+        "document_summary": analysis["document_summary"],
+        "revision": revision,
+    }
+
+
+def stored_analysis_version() -> str:
+    """Stored clause analyses are only reused when written under this version."""
+    return catalogs.current().analyzer.cache.version
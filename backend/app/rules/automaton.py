@@ -0,0 +1,173 @@
+import re
+from typing import Iterable, List, Tuple
+
+
+# -------------------------
+# Aho-Corasick Keyword Automaton
+# -------------------------
+
+# Normalized text (see analyzer._normalize) only ever contains these characters
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 "
+_WIDTH = len(ALPHABET)
+_CODES = bytes.maketrans(ALPHABET.encode("ascii"), bytes(range(_WIDTH)))
+
+
+class KeywordAutomaton:
+    """
+    Multi-pattern matcher compiled once over a fixed set of normalized
+    patterns. A single left-to-right pass reports every occurrence of
+    every pattern, including overlapping and nested ones.
+    """
+
+    __slots__ = ("patterns", "_delta", "_outputs", "_accepting_limit", "_start")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+
+        # Trie (goto function)
+        goto: List[dict] = [{}]
+        own: List[List[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                code = ALPHABET.index(ch)
+                nxt = goto[state].get(code)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][code] = nxt
+                    goto.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(idx)
+
+        # Failure links, breadth-first so shorter suffixes resolve first
+        fail = [0] * len(goto)
+        order = [0] + list(goto[0].values())
+        for state in order:
+            if not state:
+                continue
+            for code, nxt in goto[state].items():
+                f = fail[state]
+                while f and code not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(code, 0)
+                order.append(nxt)
+
+        outputs: List[Tuple[int, ...]] = [()] * len(goto)
+        for state in order:
+            outputs[state] = tuple(own[state]) + (outputs[fail[state]] if state else ())
+
+        # Renumber so that every state with output sorts first; scanning then
+        # needs a single integer comparison to know whether to emit.
+        ranked = sorted(range(len(goto)), key=lambda s: (not outputs[s], s))
+        new_id = {old: new for new, old in enumerate(ranked)}
+
+        # Dense transition table with state ids pre-multiplied by the alphabet width
+        delta = [0] * (len(goto) * _WIDTH)
+        for state in order:
+            base = new_id[state] * _WIDTH
+            fail_base = new_id[fail[state]] * _WIDTH
+            for code in range(_WIDTH):
+                target = goto[state].get(code)
+                if target is not None:
+                    delta[base + code] = new_id[target] * _WIDTH
+                elif state:
+                    delta[base + code] = delta[fail_base + code]
+                else:
+                    delta[base + code] = base
+
+        self._delta = delta
+        self._outputs = [outputs[old] for old in ranked]
+        self._accepting_limit = sum(1 for o in outputs if o) * _WIDTH
+        self._start = new_id[0] * _WIDTH
+
+    def scan(self, normalized_text: str) -> List[Tuple[int, int]]:
+        """
+        Return (end_offset, pattern_index) for every match, where end_offset
+        is exclusive. Text must already be normalized.
+        """
+        delta = self._delta
+        outputs = self._outputs
+        limit = self._accepting_limit
+        matches = []
+        state = self._start
+        end = 0
+        for code in normalized_text.encode("ascii").translate(_CODES):
+            state = delta[state + code]
+            end += 1
+            if state < limit:
+                for idx in outputs[state // _WIDTH]:
+                    matches.append((end, idx))
+        return matches
+
+
+# -------------------------
+# Trie Regex Matcher
+# -------------------------
+
+def trie_regex(words: Iterable[str]) -> str:
+    """
+    One regex matching any of the literal words, shaped as a trie: at each
+    position the regex engine follows one branch per character instead of
+    trying every word in turn. Longer words are preferred, so a match is
+    the longest word starting at its position.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class LiteralMatcher:
+    """
+    Substring matching of a fixed set of raw literals, each owned by a rule.
+    Unlike KeywordAutomaton it takes any text, not just normalized text.
+
+    The literals form one trie-shaped regex, so a single pass over a text
+    reports every rule owning a literal that occurs in it.
+    """
+
+    __slots__ = ("_regex", "_implied", "_always")
+
+    def __init__(self, literals: Iterable[Tuple[str, int]]):
+        owners: dict[str, set] = {}
+        for literal, owner in literals:
+            owners.setdefault(literal, set()).add(owner)
+        # The empty string occurs in every text
+        self._always = frozenset(owners.pop("", ()))
+
+        # Literals matching at the same position are prefixes of the longest
+        # one, so each match stands for the owners of all of its prefixes
+        self._implied = {
+            literal: frozenset().union(*(
+                owners.get(literal[:end], ()) for end in range(1, len(literal) + 1)
+            ))
+            for literal in owners
+        }
+        self._regex = re.compile(trie_regex(owners)) if owners else None
+
+    def fired(self, text: str) -> set:
+        """Owners of every literal occurring in text."""
+        found = set(self._always)
+        if self._regex is not None:
+            search = self._regex.search
+            implied = self._implied
+            m = search(text)
+            while m:
+                found.update(implied[m.group()])
+                # Resume one character on: matches may overlap
+                m = search(text, m.start() + 1)
+        return found
@@ -0,0 +1,320 @@
+import hashlib
+from bisect import bisect_right
+from typing import Iterable, List, Sequence, Tuple
+
+from ..text_utils import NormalizedText, locate_spans, normalize
+from .automaton import KeywordAutomaton
+from .index import RuleIndex
+
+
+# -------------------------
+# Compiled Rule Catalogs
+# -------------------------
+
+RISK_RANK = {"High": 3, "Medium": 2, "Low": 1}
+SEVERITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+
+class CompiledRule:
+    """
+    Immutable, pre-normalized view of one catalog rule.
+
+    Keyword rules (rules/catalog.py) fill keywords/single/multi/phrases/tokens;
+    pattern rules (extra.py) fill patterns. Pattern ids refer to the owning
+    CompiledRuleSet's automaton.
+    """
+
+    __slots__ = (
+        "rule",
+        "keywords",
+        "single",
+        "multi",
+        "phrases",
+        "tokens",
+        "patterns",
+        "anchors",
+        "min_hits",
+        "risk_rank",
+        "keyword_count",
+    )
+
+    def __init__(
+        self,
+        rule,
+        risk_rank: int,
+        min_hits: int = 1,
+        keywords: Tuple[Tuple[str, int], ...] = (),
+        single: Tuple[int, ...] = (),
+        multi: Tuple[int, ...] = (),
+        phrases: Tuple[Tuple[str, int], ...] = (),
+        tokens: Tuple[int, ...] = (),
+        patterns: Tuple[str, ...] = (),
+    ):
+        self.rule = rule
+        self.risk_rank = risk_rank
+        self.min_hits = min_hits
+        # (original keyword, pattern id) in catalog order
+        self.keywords = keywords
+        # Pattern ids of single-token keywords (counted per whole-token hit)
+        self.single = single
+        # Pattern ids of multi-token keywords (counted once if present)
+        self.multi = multi
+        self.phrases = phrases
+        # Distinct keyword tokens, used for proximity
+        self.tokens = tokens
+        # Lowercased raw patterns, matched as substrings
+        self.patterns = patterns
+        self.keyword_count = max(1, len(keywords))
+        # Pattern ids of which at least one must be present for any hit
+        self.anchors = tuple(pid for _, pid in keywords) + tuple(pid for _, pid in phrases) + tokens
+
+
+class KeywordScan:
+    """Every keyword occurrence in one normalized text, from a single pass."""
+
+    __slots__ = ("present", "token_positions", "negated")
+
+    def __init__(self, present: set, token_positions: dict, negated: set):
+        self.present = present
+        self.token_positions = token_positions
+        self.negated = negated
+
+
+class CompiledRuleSet:
+    """
+    A catalog compiled once at startup: every rule pre-normalized, one
+    automaton over all of their keywords, and for keyword rules an inverted
+    index to skip rules that cannot match.
+    """
+
+    __slots__ = ("rules", "patterns", "_automaton", "index", "negation_ids", "empty_ids", "version")
+
+    def __init__(self, rules: Sequence[CompiledRule], pattern_ids: dict, negation_ids=(), index: RuleIndex | None = None):
+        self.rules: Tuple[CompiledRule, ...] = tuple(rules)
+        # Content hash of the source catalog; changes whenever any rule does
+        self.version = hashlib.sha256(
+            repr([entry.rule for entry in self.rules]).encode("utf-8")
+        ).hexdigest()[:16]
+        # Patterns by id; the automaton over them is only built on first use
+        self.patterns: Tuple[str, ...] = tuple(pattern_ids)
+        self._automaton = None
+        self.negation_ids = frozenset(negation_ids)
+        # Empty normalized patterns are trivially contained in any text
+        self.empty_ids = frozenset(pid for p, pid in pattern_ids.items() if not p)
+        self.index = index
+
+    @property
+    def automaton(self) -> KeywordAutomaton:
+        if self._automaton is None:
+            self._automaton = KeywordAutomaton(self.patterns)
+        return self._automaton
+
+    @classmethod
+    def from_keyword_rules(cls, rules: Iterable, negations: Iterable[str] = ()) -> "CompiledRuleSet":
+        """Compile rules/catalog.py style rules (keywords, optional phrases)."""
+        pattern_ids: dict[str, int] = {}
+
+        def pattern_id(pattern: str) -> int:
+            return pattern_ids.setdefault(pattern, len(pattern_ids))
+
+        negation_ids = [pattern_id(neg) for neg in negations]
+        compiled = []
+        always = []
+        for i, rule in enumerate(rules):
+            keywords, single, multi = [], [], []
+            tokens: dict[int, None] = {}
+            for kw in getattr(rule, "keywords", []):
+                kw_tokens = normalize(kw).split()
+                pid = pattern_id(" ".join(kw_tokens))
+                keywords.append((kw, pid))
+                (single if len(kw_tokens) == 1 else multi).append(pid)
+                for tok in kw_tokens:
+                    tokens[pattern_id(tok)] = None
+            phrases = tuple(
+                (ph, pattern_id(normalize(ph))) for ph in getattr(rule, "phrases", [])
+            )
+            if rule.min_hits <= 0:
+                always.append(i)
+            compiled.append(CompiledRule(
+                rule,
+                risk_rank=RISK_RANK[rule.risk_level],
+                min_hits=rule.min_hits,
+                keywords=tuple(keywords),
+                single=tuple(single),
+                multi=tuple(multi),
+                phrases=phrases,
+                tokens=tuple(tokens),
+            ))
+        index = RuleIndex((entry.anchors for entry in compiled), always=always)
+        return cls(compiled, pattern_ids, negation_ids=negation_ids, index=index)
+
+    @classmethod
+    def from_pattern_rules(cls, rules: Iterable) -> "CompiledRuleSet":
+        """
+        Compile extra.py style rules (raw substring patterns, lowercased).
+        They are matched on lowercased text (see extra.literal_matcher), so
+        the set has no keyword automaton or index.
+        """
+        compiled = [
+            CompiledRule(
+                rule,
+                risk_rank=SEVERITY_RANK[rule.severity],
+                patterns=tuple(p.lower() for p in rule.patterns),
+            )
+            for rule in rules
+        ]
+        return cls(compiled, {})
+
+    @classmethod
+    def from_term_rules(cls, terms: Iterable) -> "CompiledRuleSet":
+        """
+        Compile rules/catalog.IMPORTANT_TERMS style terms: keywords only,
+        ranked by importance.
+        """
+        pattern_ids: dict[str, int] = {}
+        compiled = []
+        for term in terms:
+            keywords = tuple(
+                (kw, pattern_ids.setdefault(normalize(kw), len(pattern_ids)))
+                for kw in term.keywords
+            )
+            compiled.append(CompiledRule(
+                term,
+                risk_rank=RISK_RANK[term.importance],
+                keywords=keywords,
+            ))
+        return cls(compiled, pattern_ids)
+
+    def matches(self, text: NormalizedText) -> List[Tuple[int, int]]:
+        """
+        Automaton matches in text.normalized, as KeywordAutomaton.scan
+        reports them. Kept on the text, so a combined scan of several rule
+        sets (see catalogs.Catalogs.scanner) can fill them in for all of
+        them at once.
+        """
+        matches = text.matches.get(self)
+        if matches is None:
+            matches = text.matches[self] = self.automaton.scan(text.normalized)
+        return matches
+
+    def scan(self, text: NormalizedText) -> KeywordScan:
+        """Scan normalized text once and collect every pattern occurrence."""
+        return self._collect(text, self.matches(text), 0, len(text.normalized))
+
+    def scan_spans(self, text: NormalizedText, spans: Sequence[Tuple[int, int]]) -> Tuple[KeywordScan, List[KeywordScan]]:
+        """
+        Scan normalized text once and return its KeywordScan together with
+        one for each (start, end) span of it. Spans must start and end on
+        token boundaries; each span's scan is identical to scanning
+        text.normalized[start:end] on its own.
+        """
+        matches = self.matches(text)
+        ends = [end for end, _ in matches]
+        spans_scans = [
+            self._collect(
+                text,
+                matches[bisect_right(ends, start):bisect_right(ends, end)],
+                start,
+                end,
+            )
+            for start, end in spans
+        ]
+        return self._collect(text, matches, 0, len(text.normalized)), spans_scans
+
+    def _collect(self, text: NormalizedText, matches, span_start: int, span_end: int) -> KeywordScan:
+        present = set(self.empty_ids)
+        token_positions: dict[int, list[int]] = {}
+        negated = set()
+
+        normalized = text.normalized
+        starts = text.token_index
+        patterns = self.patterns
+        negation_ids = self.negation_ids
+        # Token positions are reported relative to the span
+        base = starts.get(span_start, 0)
+        for end, pid in matches:
+            start = end - len(patterns[pid])
+            if start < span_start:
+                continue
+            present.add(pid)
+            # Whole-token occurrence
+            if start in starts and (end == span_end or normalized[end] == " "):
+                idx = starts[start] - base
+                token_positions.setdefault(pid, []).append(idx)
+                if pid in negation_ids:
+                    negated.update((idx + 1, idx + 2, idx + 3))
+        return KeywordScan(present, token_positions, negated)
+
+
+# -------------------------
+# Combined Scan
+# -------------------------
+
+class CatalogScanner:
+    """
+    One automaton over the patterns of several compiled rule sets.
+
+    A single pass over a text records every rule set's matches on it
+    (NormalizedText.matches), exactly as each set's own automaton would
+    report them, so the catalogs read their results without rescanning.
+    See catalogs.Catalogs.scanner.
+    """
+
+    __slots__ = ("rule_sets", "automaton", "_first", "_locals")
+
+    def __init__(self, rule_sets: Iterable[CompiledRuleSet]):
+        self.rule_sets = tuple(rule_sets)
+        first, *others = self.rule_sets
+        # The first set's patterns keep their ids in the combined automaton
+        pattern_ids = {pattern: pid for pid, pattern in enumerate(first.patterns)}
+        self._first = len(pattern_ids)
+        # For every other set: combined pattern id -> its own pattern id
+        self._locals = []
+        for rule_set in others:
+            self._locals.append({
+                pattern_ids.setdefault(pattern, len(pattern_ids)): local
+                for local, pattern in enumerate(rule_set.patterns)
+            })
+        self.automaton = KeywordAutomaton(pattern_ids)
+
+    def _split(self, matches) -> list[list]:
+        first = self._first
+        per_set = [[match for match in matches if match[1] < first]]
+        per_set += [
+            [(end, local[pid]) for end, pid in matches if pid in local]
+            for local in self._locals
+        ]
+        return per_set
+
+    def scan(self, text: NormalizedText) -> None:
+        """Record every rule set's matches on text from one pass."""
+        if all(rule_set in text.matches for rule_set in self.rule_sets):
+            return
+        per_set = self._split(self.automaton.scan(text.normalized))
+        for rule_set, matches in zip(self.rule_sets, per_set):
+            text.matches.setdefault(rule_set, matches)
+
+    def scan_parts(self, document: NormalizedText, parts: Sequence[NormalizedText]) -> None:
+        """
+        Record matches on the document and on each part of it (e.g. its
+        clauses) from one pass over the document. Parts that cannot be
+        located in it are scanned on their own.
+        """
+        self.scan(document)
+        matches = [document.matches[rule_set] for rule_set in self.rule_sets]
+        ends = [[e for e, _ in found] for found in matches]
+        for part, span in zip(parts, locate_spans(document, parts)):
+            if span is None:
+                self.scan(part)
+                continue
+            start, end = span
+            for rule_set, found, found_ends in zip(self.rule_sets, matches, ends):
+                if rule_set in part.matches:
+                    continue
+                patterns = rule_set.patterns
+                # Matches lying wholly inside the span, offsets relative to it
+                part.matches[rule_set] = [
+                    (e - start, pid)
+                    for e, pid in found[bisect_right(found_ends, start):bisect_right(found_ends, end)]
+                    if e - len(patterns[pid]) >= start
+                ]
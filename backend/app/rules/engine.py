@@ -1,22 +1,76 @@
 from typing import List, Dict
 import re
-from .catalog import RULES, Rule
+from .. import catalogs
+from ..text_utils import NormalizedText
 
 
-def analyze_document_with_rules(text: str) -> List[Dict]:
+# Pattern rules (id/category/severity/patterns/summary/recommendation) live in
+# extra.py; rules/catalog.py holds the keyword rules used by analyzer.py.
+# Their matcher is compiled with the other catalogs (catalogs.Catalogs.engine).
+
+# Characters that make a pattern more than a literal substring
+_REGEX_SYNTAX = set("()[]{}?*+|^$\\.")
+
+
+class PatternMatcher:
+    """
+    Every pattern of a pattern catalog, compiled once.
+
+    Lowercase literal patterns (nearly all of them) are found by the pass
+    extra.PatternCatalog already makes over the lowercased text: they match
+    there exactly as they would here. The few using regex syntax ("2.5%",
+    "(30)") or capitals are searched on their own.
+    """
+
+    __slots__ = ("rules", "_literal_rules", "_searched")
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        # Pattern id (numbered as extra.literal_matcher does) -> rule index
+        literal_rules = {}
+        searched = []
+        pid = 0
+        for i, rule in enumerate(self.rules):
+            compiled = []
+            for pattern in rule.patterns:
+                if _REGEX_SYNTAX.intersection(pattern) or pattern != pattern.lower():
+                    compiled.append(re.compile(pattern))
+                else:
+                    literal_rules[pid] = i
+                pid += 1
+            if compiled:
+                searched.append((i, tuple(compiled)))
+        self._literal_rules = literal_rules
+        self._searched = tuple(searched)
+
+    def fired(self, lower: str, pattern_hits: set) -> set:
+        """
+        Indices of the rules with a pattern found in the lowercased text,
+        given the ids of the extra patterns occurring in it.
+        """
+        literal_rules = self._literal_rules
+        found = {literal_rules[pid] for pid in pattern_hits if pid in literal_rules}
+        for i, patterns in self._searched:
+            if i not in found and any(pattern.search(lower) for pattern in patterns):
+                found.add(i)
+        return found
+
+
+def analyze_document_with_rules(text: "str | NormalizedText") -> List[Dict]:
     findings = []
-    text = text.lower()
-
-    for rule in RULES:
-        for pattern in rule.patterns:
-            if re.search(pattern, text):
-                findings.append({
-                    "rule_id": rule.id,
-                    "category": rule.category,
-                    "severity": rule.severity,
-                    "summary": rule.summary,
-                    "recommendation": rule.recommendation,
-                })
-                break
-
-    return findings
\ No newline at end of file
+    current = catalogs.current()
+    document = NormalizedText.of(text)
+    matcher = current.engine
+    fired = matcher.fired(document.lower, current.extra.pattern_hits(document))
+
+    for i in sorted(fired):
+        rule = matcher.rules[i]
+        findings.append({
+            "rule_id": rule.id,
+            "category": rule.category,
+            "severity": rule.severity,
+            "summary": rule.summary,
+            "recommendation": rule.recommendation,
+        })
+
+    return findings
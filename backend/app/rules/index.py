@@ -0,0 +1,30 @@
+from typing import Iterable, List
+
+
+class RuleIndex:
+    """
+    Inverted index from anchor pattern id to the rules that use it.
+
+    A text only needs to be scored against rules with at least one anchor
+    present; every other rule is known not to match and can be skipped.
+    """
+
+    __slots__ = ("_by_anchor", "_always")
+
+    def __init__(self, anchors: Iterable[Iterable[int]], always: Iterable[int] = ()):
+        by_anchor: dict[int, list[int]] = {}
+        for rule_idx, rule_anchors in enumerate(anchors):
+            for anchor in set(rule_anchors):
+                by_anchor.setdefault(anchor, []).append(rule_idx)
+        self._by_anchor = {a: tuple(rules) for a, rules in by_anchor.items()}
+        self._always = frozenset(always)
+
+    def candidates(self, present: Iterable[int]) -> List[int]:
+        """Indices of rules that may match, in catalog order."""
+        found = set(self._always)
+        by_anchor = self._by_anchor
+        for anchor in present:
+            rules = by_anchor.get(anchor)
+            if rules:
+                found.update(rules)
+        return sorted(found)
@@ -0,0 +1,115 @@
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+
+# -------------------------
+# Compiled Catalog Snapshot
+# -------------------------
+
+# Compiled rule sets, automata and indexes, pickled together by
+# `python -m app.snapshot` so a cold start can skip compiling them
+SNAPSHOT_PATH = Path(os.getenv(
+    "CLARISCAN_RULES_SNAPSHOT",
+    Path(__file__).with_name("compiled_rules.snapshot"),
+))
+
+# The catalogs and every module deciding what gets compiled from them,
+# relative to the app package
+_SOURCES = (
+    "rules/catalog.py",
+    "extra.py",
+    "analyzer.py",
+    "terms.py",
+    "catalogs.py",
+    "text_utils.py",
+    "rules/compiled.py",
+    "rules/automaton.py",
+    "rules/index.py",
+)
+
+_HASH_SIZE = 64
+
+
+def source_hash() -> str:
+    """
+    Hash of the catalog sources, the Python version and the package name
+    (pickles refer to classes by module path: "app.extra" is not
+    "backend.app.extra").
+    """
+    digest = hashlib.sha256(f"{sys.version}:{__package__}".encode("utf-8"))
+    here = Path(__file__).parent
+    for source in _SOURCES:
+        digest.update((here / source).read_bytes())
+    return digest.hexdigest()
+
+
+def _read(path: Path) -> Dict:
+    # One memory-mapped read: the hash header, then the pickled objects
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:_HASH_SIZE] != source_hash().encode("ascii"):
+                return {}
+            with memoryview(data)[_HASH_SIZE:] as payload:
+                return pickle.loads(payload)
+    except Exception:
+        # Unreadable or incompatible: compile instead
+        return {}
+
+
+_objects: Dict | None = None
+_loaded = False
+
+
+def load(name: str, build: Callable):
+    """
+    The compiled object stored in the snapshot under `name`, or build() when
+    the snapshot is missing or was written from other catalog sources. Each
+    object is handed out once, so a catalog reload can free it.
+    """
+    global _objects, _loaded
+    if _objects is None:
+        _objects = _read(SNAPSHOT_PATH)
+        _loaded = bool(_objects)
+    obj = _objects.pop(name, None)
+    return build() if obj is None else obj
+
+
+def loaded() -> bool:
+    """Whether the compiled catalogs came from the snapshot."""
+    return _loaded
+
+
+def write(path: Path = SNAPSHOT_PATH) -> int:
+    """
+    Pickle every compiled catalog in one file and return its size. Objects
+    are pickled together, so those shared between modules (the scanner's
+    rule sets) stay shared when loaded.
+    """
+    from .catalogs import Catalogs, builtin_source
+
+    # Compiled from the built-in catalogs, automata included
+    catalogs = Catalogs(0, builtin_source(), None)
+    objects = {
+        "analyzer": catalogs.analyzer.compiled,
+        "extra": catalogs.extra.compiled,
+        "extra.patterns": catalogs.extra.patterns,
+        "terms": catalogs.terms.compiled,
+        "scanner": catalogs.scanner,
+    }
+    data = source_hash().encode("ascii") + pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = Path(f"{path}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    size = write()
+    print(f"Wrote {SNAPSHOT_PATH} ({size} bytes) in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,111 @@
+import json
+from itertools import chain
+from typing import Dict, Iterable, Iterator
+
+from . import analyzer, catalogs, crud, revisions, terms
+from .clause_utils import ClauseSplitter
+from .database import SessionLocal
+from .text_utils import NormalizedText
+
+
+# -------------------------
+# Streaming Analysis
+# -------------------------
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+# Same threshold as the buffered /analyze endpoint
+MIN_TEXT_LENGTH = 20
+# Clauses scored together before their events go out: small enough that a
+# single-chunk upload still streams, large enough to keep batch scoring
+CLAUSE_BATCH_SIZE = 8
+
+
+def peek_text(chunks: Iterable[str]) -> tuple[bool, Iterator[str]]:
+    """
+    Read chunks until there is enough text to analyze. Returns whether
+    there is, and an iterator that replays the chunks already read.
+    """
+    chunks = iter(chunks)
+    seen = []
+    for chunk in chunks:
+        seen.append(chunk)
+        if len("".join(seen).strip()) >= MIN_TEXT_LENGTH:
+            return True, chain(seen, chunks)
+    return False, iter(seen)
+
+
+def iter_analysis(chunks: Iterable[str], document_id: int, filename: str) -> Iterator[Dict]:
+    """
+    Analyze a document arriving in chunks (e.g. PDF pages) and yield events
+    as results become available:
+
+    - "document": the stored document's id and filename, immediately
+    - "clause": one per clause, in order, as soon as it has been split off
+      and analyzed (in batches of CLAUSE_BATCH_SIZE)
+    - "summary": the document summary and important terms, as soon as the
+      whole text is known; for a single chunk (a text upload) this comes
+      before every clause
+    - "done": the clause count
+
+    Clause results are stored when the stream completes, so the document
+    can be referenced as the previous version of a later upload.
+    """
+    yield {"event": "document", "document_id": document_id, "filename": filename}
+
+    clauses, results = [], []
+
+    def clause_events(new_clauses: list[str]) -> Iterator[Dict]:
+        for start in range(0, len(new_clauses), CLAUSE_BATCH_SIZE):
+            batch = new_clauses[start:start + CLAUSE_BATCH_SIZE]
+            for clause, result in zip(batch, analyzer.analyze_clause_batch(batch)):
+                clauses.append(clause)
+                results.append(result)
+                yield {
+                    "event": "clause",
+                    "index": len(clauses) - 1,
+                    "clause_text": clause,
+                    "analysis": result,
+                }
+
+    # Hold one chunk back: the summary goes out as soon as the last one is read
+    splitter = ClauseSplitter()
+    text_parts = []
+    chunks = iter(chunks)
+    last = next(chunks, None)
+    for chunk in chunks:
+        text_parts.append(last)
+        yield from clause_events(splitter.feed(last))
+        last = chunk
+    if last is not None:
+        text_parts.append(last)
+
+    document = NormalizedText("".join(text_parts))
+    catalogs.current().scanner.scan(document)
+    yield {
+        "event": "summary",
+        "document_summary": analyzer.analyze_document(document),
+        "important_terms": terms.extract_important_terms(document),
+    }
+
+    if last is not None:
+        yield from clause_events(splitter.feed(last))
+    yield from clause_events(splitter.close())
+
+    db = SessionLocal()
+    try:
+        crud.create_clauses(db, document_id, clauses, results, revisions.stored_analysis_version())
+    finally:
+        db.close()
+
+    yield {"event": "done", "total_clauses": len(clauses)}
+
+
+def frame(event: Dict, fmt: str) -> str:
+    """One event as an NDJSON line or a Server-Sent Event."""
+    if fmt == "sse":
+        return f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+    return json.dumps(event) + "\n"
@@ -0,0 +1,95 @@
+import re
+from typing import Dict, List
+
+from . import catalogs
+from .rules.compiled import CompiledRuleSet
+from .text_utils import NormalizedText, normalize
+
+
+# -------------------------
+# Important Terms
+# -------------------------
+
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    words = normalize(keyword).split()
+    if not words:
+        # Symbols only ("$", "%"), invisible to the normalized scan: matched as is
+        return re.compile(re.escape(keyword.lower()))
+    # Whole words, separated by anything that normalizes to a single space;
+    # the word boundary before the first word is checked after it, so the
+    # pattern starts with a literal the regex engine can search for quickly
+    first = re.escape(words[0])
+    return re.compile(
+        first + rf"(?<![a-z0-9]{first})" + "".join(r"[^a-z0-9]+" + re.escape(w) for w in words[1:]) + r"(?![a-z0-9])"
+    )
+
+
+class TermCatalog:
+    """
+    One version of the important terms (see catalogs.Catalogs): the compiled
+    term set and, for every keyword, the pattern locating it in the
+    lowercased text.
+    """
+
+    __slots__ = ("compiled", "keyword_patterns")
+
+    def __init__(self, compiled: CompiledRuleSet):
+        self.compiled = compiled
+        self.keyword_patterns = {
+            keyword: _keyword_pattern(keyword)
+            for entry in compiled.rules
+            for keyword, _ in entry.keywords
+        }
+
+
+def _text_offsets(document: NormalizedText) -> list[int]:
+    # Offset in `lower` -> offset in `text`
+    offsets = [i for i, ch in enumerate(document.text) for _ in ch.lower()]
+    offsets.append(len(document.text))
+    return offsets
+
+
+def extract_important_terms(text: "str | NormalizedText") -> List[Dict]:
+    """
+    Every important term with a keyword present as whole words, in catalog
+    order, with its first occurrence: the keyword, its (start, end) span in
+    the original text and the sentence around it.
+
+    Presence comes from the keyword scan, which catalogs.Catalogs.scanner
+    shares with the risk rules; only keywords found there are then located in the text.
+    Symbol keywords ("$", "%") are always looked up directly.
+    """
+    catalog = catalogs.current().terms
+    document = NormalizedText.of(text)
+    scan = catalog.compiled.scan(document)
+    # Offsets in `lower` are offsets in `text` unless lowercasing changed the length
+    offsets = None if len(document.lower) == len(document.text) else _text_offsets(document)
+    found = []
+    for entry in catalog.compiled.rules:
+        # Keywords the scan found as whole words, and symbol keywords
+        matches = []
+        for kw, pid in entry.keywords:
+            if pid in scan.token_positions or pid in catalog.compiled.empty_ids:
+                m = catalog.keyword_patterns[kw].search(document.lower)
+                if m:
+                    matches.append((m.span(), kw))
+        if not matches:
+            continue
+        (start, end), keyword = min(matches)
+        if offsets is not None:
+            start, end = offsets[start], offsets[end]
+        sentence = document.sentence_at(start)
+
+        term = entry.rule
+        found.append({
+            "id": term.id,
+            "title": term.title,
+            "importance": term.importance,
+            "category": term.category,
+            "description": term.description,
+            "display_hint": term.display_hint,
+            "keyword": keyword,
+            "span": [start, end],
+            "sentence": document.sentences[sentence].strip() if sentence is not None else None,
+        })
+    return found
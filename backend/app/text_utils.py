@@ -0,0 +1,121 @@
+import re
+from bisect import bisect_right
+from functools import cached_property
+
+from .numeric import NumericScan, scan_numbers
+
+
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def normalize(text: str) -> str:
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+class NormalizedText:
+    """
+    One clause or document, normalized once and shared by every rule
+    and extractor that looks at it.
+
+    Token offsets refer to `normalized`; sentence spans refer to `text`.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        # Keyword automaton matches per compiled rule set (see rules.compiled)
+        self.matches: dict = {}
+
+    @classmethod
+    def of(cls, text: "str | NormalizedText") -> "NormalizedText":
+        return text if isinstance(text, NormalizedText) else cls(text)
+
+    @cached_property
+    def normalized(self) -> str:
+        # Raw-pattern matchers only need `lower`
+        return normalize(self.text)
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        return self.normalized.split()
+
+    @cached_property
+    def token_offsets(self) -> list[int]:
+        offsets = []
+        offset = 0
+        for tok in self.tokens:
+            offsets.append(offset)
+            offset += len(tok) + 1
+        return offsets
+
+    @cached_property
+    def token_index(self) -> dict[int, int]:
+        """Character offset in `normalized` -> index of the token starting there."""
+        return {offset: i for i, offset in enumerate(self.token_offsets)}
+
+    @cached_property
+    def token_positions(self) -> dict[str, list[int]]:
+        positions: dict[str, list[int]] = {}
+        for i, tok in enumerate(self.tokens):
+            positions.setdefault(tok, []).append(i)
+        return positions
+
+    @cached_property
+    def sentence_spans(self) -> list[tuple[int, int]]:
+        """(start, end) of each sentence in `text`, as split by SENTENCE_BREAK."""
+        spans = []
+        start = 0
+        for m in SENTENCE_BREAK.finditer(self.text):
+            spans.append((start, m.start()))
+            start = m.end()
+        spans.append((start, len(self.text)))
+        return spans
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @cached_property
+    def numbers(self) -> NumericScan:
+        """Time, percentage and number matches in `text`, from one scan."""
+        return scan_numbers(self.text, self.lower)
+
+    @cached_property
+    def sentence_starts(self) -> list[int]:
+        return [start for start, _ in self.sentence_spans]
+
+    def sentence_at(self, offset: int) -> int | None:
+        """Index of the sentence containing character `offset` of `text`."""
+        i = bisect_right(self.sentence_starts, offset) - 1
+        if i >= 0 and offset < self.sentence_spans[i][1]:
+            return i
+        return None
+
+
+def locate_spans(document: NormalizedText, parts: list[NormalizedText]) -> list[tuple[int, int] | None]:
+    """
+    Find each part's normalized text (e.g. a clause) in the normalized
+    document, in order and on token boundaries. Parts that cannot be found
+    map to None.
+    """
+    text = document.normalized
+    size = len(text)
+    spans = []
+    cursor = 0
+    for part in parts:
+        needle = part.normalized
+        pos = text.find(needle, cursor) if needle else -1
+        while pos != -1:
+            end = pos + len(needle)
+            if (pos == 0 or text[pos - 1] == " ") and (end == size or text[end] == " "):
+                break
+            pos = text.find(needle, pos + 1)
+        if pos == -1:
+            spans.append(None)
+            continue
+        spans.append((pos, pos + len(needle)))
+        cursor = pos + len(needle)
+    return spans
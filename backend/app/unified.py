@@ -0,0 +1,53 @@
+from typing import Dict
+
+from . import analyzer, catalogs, extra, terms
+from .clause_utils import split_into_clauses
+from .rules import engine
+from .text_utils import NormalizedText
+
+
+# -------------------------
+# Unified Catalog Scan
+# -------------------------
+
+def analyze_all(
+    document_text: "str | NormalizedText",
+    clauses: list[str] | None = None,
+    proximity_window: int = analyzer.PROXIMITY_WINDOW,
+) -> Dict:
+    """
+    Run every catalog over one document, each result in the format of its
+    own engine. The keyword catalogs share a single scan of the normalized
+    text. The pattern catalogs share one trie pass over the lowercased
+    document (rules.engine searches its few regex patterns on their own)
+    and take one over each clause: clauses are whitespace-collapsed, so
+    their raw text is not a slice of the document's.
+
+    - "analyzer": analyzer.analyze_clauses (per-clause results and summary)
+    - "extra": extra.analyze_clause_with_rules per clause and
+      extra.analyze_document_with_rules
+    - "engine": rules.engine.analyze_document_with_rules
+    - "important_terms": terms.extract_important_terms
+
+    Every engine uses the catalog version current when the call starts.
+
+    Clauses default to split_into_clauses(document_text).
+    """
+    document = NormalizedText.of(document_text)
+    if clauses is None:
+        clauses = split_into_clauses(document.text)
+    parsed = [NormalizedText.of(c) for c in clauses]
+
+    current = catalogs.current()
+    with catalogs.pinned(current):
+        # The keyword catalogs' shared scan (catalogs.Catalogs.scanner)
+        current.scanner.scan_parts(document, parsed)
+        return {
+            "analyzer": analyzer.analyze_clauses(parsed, document, proximity_window),
+            "extra": {
+                "clauses": [extra.analyze_clause_with_rules(clause) for clause in parsed],
+                "document_summary": extra.analyze_document_with_rules(document),
+            },
+            "engine": engine.analyze_document_with_rules(document),
+            "important_terms": terms.extract_important_terms(document),
+        }
@@ -0,0 +1,26 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# The app package lives next to this directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# A scratch database for the endpoint tests, set before app.database is
+# imported; the clause cache stays in memory unless a test gives it a file
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='clariscan-tests-')}/clariscan.db"
+os.environ.pop("CLARISCAN_CLAUSE_CACHE_DB", None)
+os.environ.pop("CLARISCAN_CATALOG_FILE", None)
+
+
+@pytest.fixture
+def fresh_catalogs():
+    """Freshly compiled built-in catalogs, with an empty clause cache, pinned for the test."""
+    from app import catalogs
+
+    compiled = catalogs.Catalogs(1, catalogs.builtin_source(), None)
+    with catalogs.pinned(compiled):
+        yield compiled
+    compiled.analyzer.cache.close()
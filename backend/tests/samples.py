@@ -0,0 +1,70 @@
+"""
+Deterministic sample clauses and contracts for the tests, built from the
+built-in catalogs' own keywords and patterns so the engines see a mix of
+single hits, several rules competing for the headline, and no hit at all.
+"""
+
+import random
+
+from app import extra
+from app.rules.catalog import RULES
+
+# Words that are in no catalog keyword or pattern, so a clause of filler
+# alone has no finding
+FILLER = (
+    "each signatory acknowledges receipt hereof both sides confirm cooperation "
+    "good faith spirit annexes schedules exhibits attached form integral part "
+    "signed electronically original copies executed date first above recitals hereto"
+).split()
+
+DETAILS = (
+    "within 30 days",
+    "no later than ten (10) business days",
+    "a fee of $5,000",
+    "interest of 1.5% per month",
+    "for a period of twelve months",
+    "not without prior written notice",
+)
+
+HEADINGS = ("TERMINATION", "PAYMENT TERMS", "CONFIDENTIALITY", "GENERAL PROVISIONS")
+
+
+def _keywords() -> list[str]:
+    words = [kw for rule in RULES for kw in rule.keywords]
+    words += [p for rule in extra.RULES for p in rule.patterns]
+    return words
+
+
+KEYWORDS = _keywords()
+
+
+def clause_body(rng: random.Random, hits: int) -> str:
+    words = []
+    for _ in range(hits):
+        words += rng.sample(FILLER, rng.randint(2, 6))
+        words.append(rng.choice(KEYWORDS))
+    words += rng.sample(FILLER, rng.randint(12, 20))
+    if rng.random() < 0.5:
+        words.append(rng.choice(DETAILS))
+    body = " ".join(words)
+    return body[0].upper() + body[1:] + "."
+
+
+def clauses(count: int, seed: int = 0) -> list[str]:
+    """Clause texts with zero to four catalog keywords each."""
+    rng = random.Random(seed)
+    return [clause_body(rng, rng.choice((0, 1, 1, 2, 2, 3, 4))) for _ in range(count)]
+
+
+def contract(count: int, seed: int = 0, bodies: list[str] | None = None) -> str:
+    """
+    Numbered clauses (by default `count` of clauses()), now and then under
+    an unnumbered heading. The same seed places the same headings.
+    """
+    rng = random.Random(seed)
+    parts = ["MASTER SERVICES AGREEMENT\n"]
+    for number, body in enumerate(bodies or clauses(count, seed), 1):
+        if rng.random() < 0.2:
+            parts.append(f"\n{rng.choice(HEADINGS)}\n")
+        parts.append(f"{number}. {body}\n")
+    return "".join(parts)
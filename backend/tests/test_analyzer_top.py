@@ -0,0 +1,73 @@
+"""
+analyze_clause_top's branch and bound must pick the same headline finding
+as analyze_clause, including when several rules tie on risk and confidence
+(catalog order decides) and when no rule qualifies.
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from app import analyzer
+from app.text_utils import NormalizedText
+
+import samples
+
+
+def _tie_clauses(catalog) -> list[str]:
+    # One keyword each of two rules with the same risk and keyword count:
+    # both score one hit and the same confidence
+    rng = random.Random(3)
+    rules = catalog.compiled.rules
+    clauses = []
+    for first, second in itertools.combinations(rules, 2):
+        if first.risk_rank == second.risk_rank and first.keyword_count == second.keyword_count:
+            words = rng.sample(samples.FILLER, 6) + [second.keywords[0][0]]
+            words += rng.sample(samples.FILLER, 6) + [first.keywords[0][0]]
+            clauses.append(" ".join(words + rng.sample(samples.FILLER, 6)) + ".")
+    return clauses
+
+
+def _ties_and_misses(catalog, clauses: list[str]) -> tuple[int, int]:
+    # Clauses whose best ranking several rules share, and clauses with no finding
+    scans = [catalog.compiled.scan(NormalizedText(c)) for c in clauses]
+    hits, _ = analyzer._hit_matrix(catalog, scans)
+    confidence = analyzer._confidence_scores(catalog, hits)
+    ranking = np.where(hits >= catalog.min_hits, catalog.risk_rank * 1000 + confidence, -1)
+    best = ranking.max(axis=1)
+    shared = (ranking == best[:, None]).sum(axis=1) > 1
+    return int((shared & (best >= 0)).sum()), int((best < 0).sum())
+
+
+@pytest.fixture
+def corpus(fresh_catalogs) -> list[str]:
+    clauses = samples.clauses(400, seed=2) + _tie_clauses(fresh_catalogs.analyzer)
+    clauses += [" ".join(samples.FILLER) + ".", "", "1. Short."]
+    ties, misses = _ties_and_misses(fresh_catalogs.analyzer, clauses)
+    assert ties > 100 and misses > 50
+    return clauses
+
+
+@pytest.mark.parametrize("proximity_window", [2, analyzer.PROXIMITY_WINDOW, 12])
+def test_headline_matches_full_analysis(fresh_catalogs, corpus, proximity_window):
+    cache = fresh_catalogs.analyzer.cache
+    for clause in corpus:
+        top = analyzer.analyze_clause_top(clause, proximity_window)
+        full = analyzer.analyze_clause(clause, proximity_window)
+        assert {field: top[field] for field in analyzer._HEADLINE_FIELDS} == {
+            field: full[field] for field in analyzer._HEADLINE_FIELDS
+        }
+        # The clause is now cached: the same headline, and the same counter
+        # /analyze reports
+        cached = analyzer.analyze_clause_top(clause, proximity_window)
+        assert cached == {**top, "rules_skipped": full["rules_skipped"], "rules_scored": 0}
+        cache.clear()
+
+
+def test_response_shape(fresh_catalogs, corpus):
+    keys = set(analyzer._HEADLINE_FIELDS) | {"rules_skipped", "rules_scored"}
+    for clause in corpus[:50]:
+        assert set(analyzer.analyze_clause_top(clause)) == keys
+        assert set(analyzer.analyze_clause_top(clause)) == keys
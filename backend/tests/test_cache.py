@@ -0,0 +1,152 @@
+"""
+Clause result cache: hits, from memory or from the SQLite tier, must equal a
+fresh analysis, and keys must change whenever the catalogs or the
+proximity window do.
+"""
+
+import dataclasses
+import sqlite3
+
+import pytest
+
+from app import analyzer, catalogs
+from app.cache import ResultCache
+from app.text_utils import NormalizedText
+
+import samples
+
+CLAUSES = samples.clauses(60, seed=1)
+
+
+def _fresh(clause: str) -> dict:
+    # Scored from scratch, bypassing the cache entirely
+    catalog = catalogs.current().analyzer
+    parsed = NormalizedText(clause)
+    scan = catalog.compiled.scan(parsed)
+    return analyzer._analyze_clause(parsed, scan, analyzer._top_findings(catalog, [scan])[0])
+
+
+def test_memory_hit_equals_fresh_analysis(fresh_catalogs):
+    cache = fresh_catalogs.analyzer.cache
+    first = [analyzer.analyze_clause(c) for c in CLAUSES]
+    assert cache.misses == len(set(CLAUSES))
+
+    second = [analyzer.analyze_clause(c) for c in CLAUSES]
+    assert cache.hits == len(CLAUSES)
+    assert second == first == [_fresh(c) for c in CLAUSES]
+
+
+def test_hits_are_fresh_objects(fresh_catalogs):
+    clause = CLAUSES[0]
+    analyzer.analyze_clause(clause)["clause_type"] = "changed by the caller"
+    assert analyzer.analyze_clause(clause) == _fresh(clause)
+
+
+def test_sqlite_hit_equals_fresh_analysis(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyzer, "CLAUSE_CACHE_DB", str(tmp_path / "cache.db"))
+    source = catalogs.builtin_source()
+
+    writer = catalogs.Catalogs(1, source, None)
+    with catalogs.pinned(writer):
+        stored = [analyzer.analyze_clause(c) for c in CLAUSES]
+    writer.analyzer.cache.close()
+
+    # A new process: same catalogs, empty memory tier, same database
+    reader = catalogs.Catalogs(1, source, None)
+    with catalogs.pinned(reader):
+        loaded = [analyzer.analyze_clause(c) for c in CLAUSES]
+        fresh = [_fresh(c) for c in CLAUSES]
+    cache = reader.analyzer.cache
+    assert cache.db_hits == len(set(CLAUSES))
+    assert cache.misses == 0
+    assert loaded == stored == fresh
+    cache.close()
+
+
+def test_key_depends_on_proximity_window(fresh_catalogs):
+    clause = NormalizedText(CLAUSES[0])
+    catalog = fresh_catalogs.analyzer
+    keys = {analyzer._clause_key(catalog, clause, window) for window in (4, 6, 8)}
+    assert len(keys) == 3
+
+    analyzer.analyze_clause(CLAUSES[0], proximity_window=4)
+    analyzer.analyze_clause(CLAUSES[0], proximity_window=8)
+    assert catalog.cache.misses == 2
+
+
+def test_catalog_change_invalidates_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyzer, "CLAUSE_CACHE_DB", str(tmp_path / "cache.db"))
+    source = catalogs.builtin_source()
+    rule = source.rules[0]
+    edited = dataclasses.replace(source, rules=(
+        dataclasses.replace(rule, keywords=[*rule.keywords, "zzyzx"]),
+        *source.rules[1:],
+    ))
+
+    before = catalogs.Catalogs(1, source, None)
+    after = catalogs.Catalogs(2, edited, None)
+    assert before.analyzer.cache.version != after.analyzer.cache.version
+    clause = NormalizedText(CLAUSES[0])
+    assert analyzer._clause_key(before.analyzer, clause, 6) != analyzer._clause_key(after.analyzer, clause, 6)
+
+    with catalogs.pinned(before):
+        analyzer.analyze_clause(clause.text)
+    with catalogs.pinned(after):
+        analyzer.analyze_clause(clause.text)
+    assert after.analyzer.cache.db_hits == 0
+    assert after.analyzer.cache.misses == 1
+    before.analyzer.cache.close()
+    after.analyzer.cache.close()
+
+
+def test_lru_bound_and_counters():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    assert cache.get("a") == {"n": 1}
+    # "b" is now the least recently used entry
+    cache.put("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.get("c") == {"n": 3}
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 3,
+        "db_hits": 0,
+        "misses": 1,
+        "version": "",
+    }
+
+    cache.clear()
+    assert cache.stats()["size"] == cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_other_versions_kept_until_purged(tmp_path):
+    path = str(tmp_path / "cache.db")
+    old = ResultCache(db_path=path, version="old")
+    old.put("a", {"n": 1})
+
+    new = ResultCache(db_path=path, version="new")
+    new.put("b", {"n": 2})
+    # Still readable by a process on the old version
+    assert ResultCache(db_path=path, version="old").get("a") == {"n": 1}
+
+    assert new.purge() == 1
+    rows = sqlite3.connect(path).execute("SELECT key, version FROM result_cache").fetchall()
+    assert rows == [("b", "new")]
+
+
+def test_closed_cache_keeps_memory_tier(tmp_path):
+    cache = ResultCache(db_path=str(tmp_path / "cache.db"), version="v")
+    cache.put("a", {"n": 1})
+    cache.close()
+    assert cache.get("a") == {"n": 1}
+    cache.put("b", {"n": 2})
+    assert cache.get("b") == {"n": 2}
+    assert cache.purge() == 0
+
+
+@pytest.mark.parametrize("clause", ["", "   ", "1. Short."])
+def test_trivial_clauses_cached(fresh_catalogs, clause):
+    assert analyzer.analyze_clause(clause) == analyzer.analyze_clause(clause) == _fresh(clause)
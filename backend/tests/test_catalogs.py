@@ -0,0 +1,156 @@
+"""
+Catalog reloads: requests keep the version they started with, the process
+pool restarts for the new one, and only an admin can trigger a reload.
+"""
+
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import analyzer, catalogs, crud, main, parallel, streaming
+from app.database import SessionLocal
+
+import samples
+
+ZORBLAX = "Each party acknowledges the zorblax surcharge on every delivery. " + " ".join(samples.FILLER) + "."
+
+
+@pytest.fixture
+def catalog_file(tmp_path, monkeypatch):
+    """A catalog file holding the built-in catalogs, with the latest version restored afterwards."""
+    path = tmp_path / "catalogs.json"
+    catalogs.write_source(path, catalogs.builtin_source())
+    monkeypatch.setattr(catalogs, "CATALOG_PATH", str(path))
+    monkeypatch.setattr(catalogs, "status", {"last_reload": None, "error": None})
+    latest = catalogs.latest()
+    catalogs.reload()
+    yield path
+    monkeypatch.setattr(catalogs, "_latest", latest)
+    parallel.shutdown_pool()
+
+
+def _add_zorblax_rule(path):
+    source = catalogs.read_source(path)
+    rule = dataclasses.replace(
+        source.rules[0], id="ZORBLAX", title="Zorblax Surcharge", keywords=["zorblax surcharge"], min_hits=1,
+    )
+    catalogs.write_source(path, dataclasses.replace(source, rules=(rule, *source.rules)))
+
+
+def test_pinned_request_keeps_its_version(catalog_file):
+    old = catalogs.latest()
+    with catalogs.pinned():
+        assert analyzer.analyze_clause(ZORBLAX)["clause_type"] != "Zorblax Surcharge"
+        _add_zorblax_rule(catalog_file)
+        new = catalogs.reload()
+        assert new.version == old.version + 1 and catalogs.latest() is new
+        # Still the version the request started with
+        assert catalogs.current() is old
+        assert analyzer.analyze_clause(ZORBLAX)["clause_type"] != "Zorblax Surcharge"
+    assert analyzer.analyze_clause(ZORBLAX)["clause_type"] == "Zorblax Surcharge"
+
+
+def test_stream_keeps_the_version_it_started_with(catalog_file):
+    main.warm_up()
+    db = SessionLocal()
+    try:
+        document_id = crud.create_document(db, "contract.txt").id
+    finally:
+        db.close()
+    text = samples.contract(20, seed=9) + "21. " + ZORBLAX
+    events = catalogs.pin_iter(streaming.iter_analysis([text], document_id, "contract.txt"))
+
+    # Reloaded after the response has started, before any clause is scored
+    assert next(events)["event"] == "document"
+    _add_zorblax_rule(catalog_file)
+    catalogs.reload()
+    clauses = [event["analysis"]["clause_type"] for event in events if event["event"] == "clause"]
+    assert len(clauses) == 21 and "Zorblax Surcharge" not in clauses
+    assert analyzer.analyze_clause(f"21. {ZORBLAX}")["clause_type"] == "Zorblax Surcharge"
+
+
+def test_pool_restarts_for_new_catalogs(catalog_file, monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_WORKERS", 1)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_CLAUSES", 1)
+    clauses = samples.clauses(10, seed=9) + [ZORBLAX]
+
+    first = parallel.analyze_clauses(clauses)
+    pool = parallel._pool
+    assert parallel._pool_digest == catalogs.latest().digest
+    assert first["clauses"][-1]["clause_type"] != "Zorblax Surcharge"
+
+    old = catalogs.latest()
+    _add_zorblax_rule(catalog_file)
+    catalogs.reload()
+    # Until a request on the new version needs it, the pool is not restarted
+    with catalogs.pinned(old):
+        assert parallel.get_pool() is pool
+        assert parallel.analyze_clauses(clauses) == first
+
+    second = parallel.analyze_clauses(clauses)
+    assert parallel._pool is not pool
+    assert parallel._pool_digest == catalogs.latest().digest
+    assert second["clauses"][-1]["clause_type"] == "Zorblax Surcharge"
+    assert second == analyzer.analyze_clauses(clauses)
+
+    # Requests still on the old version then analyze in-process
+    with catalogs.pinned(old):
+        assert parallel.get_pool() is None
+        assert parallel.analyze_clauses(clauses) == first
+
+
+def test_failed_reload_keeps_the_latest_version(catalog_file):
+    latest = catalogs.latest()
+    catalog_file.write_text("{ not json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        catalogs.reload()
+    assert catalogs.latest() is latest
+    assert catalogs.status["error"]
+
+
+# -------------------------
+# Admin endpoints
+# -------------------------
+
+@pytest.fixture
+def client():
+    main.warm_up()
+    return TestClient(main.app)
+
+
+ADMIN_ENDPOINTS = [
+    ("POST", "/catalogs/reload"),
+    ("DELETE", "/catalogs/clause-cache"),
+    ("DELETE", "/profile/rules"),
+]
+
+
+@pytest.mark.parametrize("method, path", ADMIN_ENDPOINTS)
+def test_admin_endpoints_disabled_without_token(client, monkeypatch, method, path):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+    assert client.request(method, path, headers={"X-Admin-Token": "anything"}).status_code == 403
+
+
+@pytest.mark.parametrize("method, path", ADMIN_ENDPOINTS)
+def test_admin_endpoints_need_the_token(client, monkeypatch, method, path):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "s3cret")
+    assert client.request(method, path).status_code == 401
+    assert client.request(method, path, headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_admin_reload(client, catalog_file, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "s3cret")
+    version = catalogs.latest().version
+    _add_zorblax_rule(catalog_file)
+    response = client.post("/catalogs/reload", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["current"]["version"] == version + 1
+    assert client.get("/catalogs").json()["current"]["version"] == version + 1
+
+
+def test_admin_profile_reset(client, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "s3cret")
+    response = client.delete("/profile/rules", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json() == {"reset": True}
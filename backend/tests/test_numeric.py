@@ -0,0 +1,168 @@
+"""
+Equivalence checks for numeric.py: time expressions found through the
+numeric scan's anchors must be exactly those TIME_PATTERN.finditer finds,
+with the units the original per-unit capture groups reported.
+"""
+
+import random
+import re
+
+import pytest
+
+from app.analyzer import _extract_time_values
+from app.numeric import (
+    DEADLINE_PATTERN,
+    NUM_WORDS,
+    NUMBER_PATTERN,
+    PERCENT_PATTERN,
+    TIME_PATTERN,
+    TIME_UNIT_NAMES,
+    TIME_UNITS,
+    _time_starts,
+    scan_numbers,
+)
+from app.text_utils import NormalizedText
+
+
+# TIME_PATTERN as it was before units were looked up in TIME_UNIT_NAMES:
+# every unit alternative captured under its TIME_UNITS key
+LEGACY_TIME_PATTERN = re.compile(
+    r"\b(?P<num_word>\w+)?\s*(\(?\s*(?P<num_digit>\d+)\s*\))?\s*(?P<unit>" +
+    "|".join(f"(?P<{key}>{pattern})" for key, pattern in TIME_UNITS.items()) +
+    r")\b",
+    re.IGNORECASE
+)
+
+KELVIN = "\u212a"
+LONG_S = "\u017f"
+
+
+def _legacy_unit(match) -> str:
+    return next(key for key in TIME_UNITS if match.group(key) is not None)
+
+
+def _has_value(match) -> bool:
+    # Matches without a number are dropped by _extract_time_values
+    word = match.group("num_word")
+    return bool(match.group("num_digit")) or (
+        word is not None and (word.lower().isdecimal() or word.lower() in NUM_WORDS)
+    )
+
+
+def _times(text: str) -> list[tuple]:
+    return [(t["value"], t["unit"], t["raw_text"]) for t in _extract_time_values(NormalizedText(text))]
+
+
+# -------------------------
+# Units
+# -------------------------
+
+def _spelling_variants() -> list[str]:
+    variants = []
+    for spelling in TIME_UNIT_NAMES:
+        variants += [spelling, spelling.upper(), spelling.title()]
+        variants.append(spelling.replace("s", LONG_S))
+        variants.append(spelling.replace("k", KELVIN))
+    return variants
+
+
+@pytest.mark.parametrize("unit", _spelling_variants())
+def test_unit_names_match_legacy_groups(unit):
+    text = f"within 5 {unit} and (3) {unit}"
+    legacy = list(LEGACY_TIME_PATTERN.finditer(text))
+    current = list(TIME_PATTERN.finditer(text))
+    assert [m.span() for m in current] == [m.span() for m in legacy]
+    assert [TIME_UNIT_NAMES[m.group("unit").casefold()] for m in current] == [_legacy_unit(m) for m in legacy]
+
+
+def test_non_units_are_not_names():
+    for word in ("das", "dass", KELVIN, "k", "mon", "weekss"):
+        assert word.casefold() not in TIME_UNIT_NAMES
+
+
+# -------------------------
+# Golden Time Expressions
+# -------------------------
+
+@pytest.mark.parametrize("text, expected", [
+    ("within (30) days", [(30, "days", "within (30) days")]),
+    ("within thirty (30) days of notice", [(30, "days", "thirty (30) days")]),
+    ("one (1) year", [(1, "years", "one (1) year")]),
+    ("fifty (50) Mos", [(50, "months", "fifty (50) Mos")]),
+    ("7 (7) years", [(7, "years", "7 (7) years")]),
+    # The number sits inside a word: \w+ gives back only the last digit
+    ("a12) days", [(2, "days", "a12) days")]),
+    ("within 48 hrs", [(48, "hours", "48 hrs")]),
+    ("5D", [(5, "days", "5D")]),
+    ("Three years", [(3, "years", "Three years")]),
+    ("seventy weeks", [(70, "weeks", "seventy weeks")]),
+    ("Ten Y", [(10, "years", "Ten Y")]),
+    ("twenty-one days", [(1, "days", "one days")]),
+    ("none days", []),
+    ("no later than ten business days", []),
+    ("90-day cure period", []),
+    # "ſ" casefolds to "s", the Kelvin sign to "k"
+    (f"for 5 day{LONG_S}", [(5, "days", f"5 day{LONG_S}")]),
+    (f"3 w{KELVIN}s", [(3, "weeks", f"3 w{KELVIN}s")]),
+    (f"for 5 da{LONG_S}", []),
+    (f"2 {KELVIN}", []),
+])
+def test_time_expressions(text, expected):
+    assert _times(text) == expected
+
+
+def test_unit_word_before_parenthesised_number_is_skipped():
+    # "had d" is a "<word> <unit>" match finditer consumes, so the next
+    # match starts after "d"; trying one at "d" would give "d (3) days"
+    text = "had d (3) days"
+    assert _times(text) == [(3, "days", "(3) days")]
+    assert _time_starts(text, text.index("3")) == [(5, True), (5, False), (7, False)]
+    assert [m.span() for m in scan_numbers(text).times] == [(5, 14)]
+
+
+def test_unit_word_after_a_match_is_skipped():
+    text = "5 days (30) days"
+    assert _times(text) == [(5, "days", "5 days"), (30, "days", "(30) days")]
+
+
+# -------------------------
+# Scan vs. finditer
+# -------------------------
+
+TOKENS = [
+    "5", "30", "(3)", "( 12 )", "3)", "1,000", "1,0000", "2.5", "12.5.3", "%", " %", "01", "007",
+    "5d", "5D", "3hrs", "d", "D", "day", "days", "Days", "y", "yrs", "h", "hr", "Hrs", "w", "mo",
+    "mOs", "mth", "five", "Five", "ten", "tend", "twenty", "seventy", "seventeen", "nine", "ones",
+    "none", "and", "had", "within", "abc", "x1", "a12)", "(", ")", "((", "( (", "d(", "y (", " ",
+    "  ", "\t", "\n", ".", ",", "-", "_", LONG_S, f"day{LONG_S}", f"da{LONG_S}", f"HR{LONG_S}",
+    KELVIN, f"w{KELVIN}s", "Kwk", "wKs", "İ", "²", "٣",
+]
+
+
+def _random_texts(count: int, seed: int = 13) -> list[str]:
+    rnd = random.Random(seed)
+    return [
+        "".join(rnd.choice(TOKENS) + rnd.choice(("", " ", " ", "  ")) for _ in range(rnd.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("text", _random_texts(3000))
+def test_scan_matches_finditer(text):
+    lower = text.lower()
+    scan = scan_numbers(text, lower)
+    assert [(m.span(), TIME_UNIT_NAMES[m.group("unit").casefold()]) for m in scan.times if _has_value(m)] == [
+        (m.span(), _legacy_unit(m)) for m in LEGACY_TIME_PATTERN.finditer(text) if _has_value(m)
+    ]
+    assert [m.span() for m in scan.percents] == [m.span() for m in PERCENT_PATTERN.finditer(text)]
+    assert [m.span() for m in scan.numbers] == [m.span() for m in NUMBER_PATTERN.finditer(text)]
+    assert scan.deadlines == DEADLINE_PATTERN.findall(lower)
+
+
+def test_scan_on_unaligned_lowercase():
+    # "İ" lowercases to two characters, so deadlines fall back to findall
+    text = "İ 30 days and 2 months, 12% of 1,000"
+    scan = scan_numbers(text)
+    assert scan.deadlines == ["days", "months"]
+    assert [m.group() for m in scan.percents] == ["12%"]
+    assert [m.group() for m in scan.numbers] == ["30", "2", "12", "1,000"]
@@ -0,0 +1,50 @@
+"""
+Process-pool clause analysis: workers start from the fork server with the
+newest catalogs, and the warm-up checks they did.
+"""
+
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app import analyzer, catalogs, parallel
+
+import samples
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_WORKERS", 2)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_CLAUSES", 1)
+    yield
+    parallel.shutdown_pool()
+
+
+def test_warm_up_loads_the_newest_catalogs(pool):
+    parallel.warm_up()
+    assert parallel._pool_digest == catalogs.latest().digest
+    assert parallel._pool.submit(parallel._worker_catalogs).result() == catalogs.latest().digest
+
+
+def test_warm_up_detects_other_catalogs(pool, monkeypatch):
+    source = catalogs.builtin_source()
+    other = dataclasses.replace(source, rules=source.rules[1:])
+    # A pool whose workers loaded other catalogs than it is recorded for
+    monkeypatch.setattr(parallel, "_pool", ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=parallel._pool_context(),
+        initializer=parallel._warm_worker,
+        initargs=(other,),
+    ))
+    monkeypatch.setattr(parallel, "_pool_digest", catalogs.latest().digest)
+    with pytest.raises(RuntimeError, match="expected"):
+        parallel.warm_up()
+
+
+def test_pool_results_equal_in_process(pool):
+    clauses = samples.clauses(200, seed=10)
+    text = " ".join(clauses)
+    pooled = parallel.analyze_clauses(clauses, text)
+    catalogs.latest().analyzer.cache.clear()
+    assert pooled == analyzer.analyze_clauses(clauses, text)
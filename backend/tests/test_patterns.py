@@ -0,0 +1,183 @@
+"""
+Pattern rules are found by one trie-shaped regex pass (LiteralMatcher)
+instead of a substring check per pattern. Every rule must fire exactly when
+one of its patterns is `in` the lowercased text, as before, including for
+patterns that overlap or share prefixes.
+"""
+
+import dataclasses
+import random
+import re
+from collections import defaultdict
+
+import pytest
+
+from app import catalogs, extra
+from app.rules import engine
+from app.rules.automaton import LiteralMatcher, trie_regex
+
+import samples
+
+
+# -------------------------
+# The per-pattern checks the trie replaced
+# -------------------------
+
+SEVERITY_RANK = {"high": 3, "medium": 2, "low": 1}
+
+
+def legacy_matched(rules, text: str) -> list:
+    text = text.lower()
+    return [rule for rule in rules if any(pattern.lower() in text for pattern in rule.patterns)]
+
+
+def legacy_clause(rules, clause_text: str) -> dict:
+    matched = legacy_matched(rules, clause_text)
+    if not matched:
+        return {
+            "category": "General",
+            "risk_level": "Low",
+            "summary": "Standard contractual language with no obvious risk.",
+            "suggestion": None,
+            "matched_rules": [],
+        }
+    highest = max(matched, key=lambda r: SEVERITY_RANK[r.severity])
+    return {
+        "category": highest.category,
+        "risk_level": highest.severity.capitalize(),
+        "summary": highest.summary,
+        "suggestion": highest.recommendation,
+        "matched_rules": [r.id for r in matched],
+    }
+
+
+def legacy_document(rules, full_text: str) -> dict:
+    buckets = defaultdict(list)
+    for rule in legacy_matched(rules, full_text):
+        buckets[rule.category].append(rule)
+    high_risk = [r.summary for r in buckets.get("critical_alert", [])]
+    obligations = []
+    for r in buckets.get("critical_alert", []) + buckets.get("review_required", []):
+        if r.summary not in obligations:
+            obligations.append(r.summary)
+    return {
+        "high_risk_flags": high_risk,
+        "review_items": [r.summary for r in buckets.get("review_required", [])],
+        "key_obligations": obligations,
+        "deadlines_detected": re.findall(r"\b\d+\s+(days|day|months|month|years|year)\b", full_text.lower()),
+        "plain_english_summary": (
+            "This document contains multiple obligations and risk clauses. "
+            "Pay close attention to termination rights, payment terms, liability, "
+            "and any clauses allowing unilateral changes."
+            if high_risk else
+            "This document appears mostly standard but should still be reviewed carefully."
+        ),
+    }
+
+
+def legacy_engine(rules, text: str) -> list[str]:
+    text = text.lower()
+    return [rule.id for rule in rules if any(re.search(pattern, text) for pattern in rule.patterns)]
+
+
+# -------------------------
+# Corpora
+# -------------------------
+
+def _pattern_texts(rules, seed: int) -> list[str]:
+    # Patterns run together, cut short, recased and glued to filler, so
+    # matches overlap and stop one character short of a longer pattern
+    rng = random.Random(seed)
+    patterns = [p for rule in rules for p in rule.patterns]
+    texts = []
+    for _ in range(300):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            pattern = rng.choice(patterns)
+            choice = rng.random()
+            if choice < 0.2:
+                pattern = pattern[:rng.randint(0, len(pattern))]
+            elif choice < 0.35:
+                pattern = pattern.upper()
+            elif choice < 0.45:
+                pattern = pattern[rng.randint(0, len(pattern)):]
+            parts.append(pattern)
+            parts.append(rng.choice(("", " ", "", " " + rng.choice(samples.FILLER) + " ")))
+        texts.append("".join(parts))
+    return texts
+
+
+OVERLAPPING_RULES = (
+    extra.Rule("LATE", "critical_alert", "medium", ["late", "late fee"], "Late.", "r"),
+    extra.Rule("LATE_FEES", "review_required", "high", ["late fees", "a late fee"], "Late fees.", "r"),
+    extra.Rule("FEE", "review_required", "low", ["fee", "ee"], "Fee.", "r"),
+    extra.Rule("SUFFIX", "informational", "low", ["te fe", "fees apply"], "Suffix.", "r"),
+    extra.Rule("SHARED_PREFIX", "critical_alert", "high", ["terminat", "termination for convenience"], "Term.", "r"),
+    extra.Rule("DUPLICATE", "review_required", "medium", ["late fee", "Terminat"], "Duplicate.", "r"),
+    extra.Rule("REGEX", "informational", "low", ["(30) days", "2.5%"], "Regex.", "r"),
+)
+
+
+@pytest.fixture(params=["builtin", "overlapping"])
+def pattern_catalogs(request):
+    source = catalogs.builtin_source()
+    if request.param == "overlapping":
+        source = dataclasses.replace(source, pattern_rules=OVERLAPPING_RULES)
+    compiled = catalogs.Catalogs(1, source, None)
+    with catalogs.pinned(compiled):
+        yield compiled
+    compiled.analyzer.cache.close()
+
+
+def _corpus(rules) -> list[str]:
+    texts = _pattern_texts(rules, seed=8) + samples.clauses(100, seed=8)
+    texts += [samples.contract(40, seed=8), "", "late fee", "a late fees apply", "Termination for Convenience"]
+    return texts
+
+
+def test_clause_results_match_substring_checks(pattern_catalogs):
+    rules = pattern_catalogs.source.pattern_rules
+    for text in _corpus(rules):
+        assert extra.analyze_clause_with_rules(text) == legacy_clause(rules, text), text
+
+
+def test_document_results_match_substring_checks(pattern_catalogs):
+    rules = pattern_catalogs.source.pattern_rules
+    for text in _corpus(rules):
+        assert extra.analyze_document_with_rules(text) == legacy_document(rules, text), text
+
+
+def test_engine_findings_match_regex_search(pattern_catalogs):
+    rules = pattern_catalogs.source.pattern_rules
+    for text in _corpus(rules):
+        found = [finding["rule_id"] for finding in engine.analyze_document_with_rules(text)]
+        assert found == legacy_engine(rules, text), text
+
+
+def test_overlapping_corpus_fires_every_rule():
+    # Otherwise the overlapping catalog would not test much
+    fired = {rule.id for text in _corpus(OVERLAPPING_RULES) for rule in legacy_matched(OVERLAPPING_RULES, text)}
+    assert fired == {rule.id for rule in OVERLAPPING_RULES}
+
+
+# -------------------------
+# LiteralMatcher on its own
+# -------------------------
+
+@pytest.mark.parametrize("seed", range(10))
+def test_literal_matcher_matches_substring_checks(seed):
+    # A small alphabet, so literals overlap and share prefixes and suffixes
+    rng = random.Random(seed)
+    literals = ["".join(rng.choice("abc ") for _ in range(rng.randint(0, 5))) for _ in range(30)]
+    owned = [(literal, rng.randrange(8)) for literal in literals]
+    matcher = LiteralMatcher(owned)
+    for _ in range(200):
+        text = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 30)))
+        assert matcher.fired(text) == {owner for literal, owner in owned if literal in text}, (owned, text)
+
+
+def test_trie_regex_prefers_the_longest_literal():
+    regex = re.compile(trie_regex(["late", "late fee", "late fees", "la"]))
+    assert [m.group() for m in regex.finditer("la late fee late fees lat")] == ["la", "late fee", "late fees", "la"]
+    assert re.compile(trie_regex(["a.b", "(x)"])).fullmatch("a.b")
+    assert not re.compile(trie_regex(["a.b"])).search("axb")
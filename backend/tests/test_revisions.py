@@ -0,0 +1,100 @@
+"""
+Uploading a revision of a stored document must re-analyze only the clauses
+that changed, and give the same result as analyzing the new text afresh.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import catalogs, main, parallel
+from app.clause_utils import split_into_clauses
+
+import samples
+
+BODIES = samples.clauses(40, seed=4)
+ORIGINAL = samples.contract(40, seed=4, bodies=BODIES)
+
+
+def _redline() -> str:
+    # Three clauses edited, the rest untouched
+    bodies = list(BODIES)
+    bodies[3] = bodies[3][:-1] + ", without prior written notice."
+    bodies[17] += " The Provider may terminate at any time in its sole discretion."
+    bodies[31] = "Each party shall pay a late fee of 5% per month on overdue invoices. " + bodies[31]
+    return samples.contract(40, seed=4, bodies=bodies)
+
+
+@pytest.fixture
+def client():
+    main.warm_up()
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Clause lists passed to parallel.analyze_clauses, in call order."""
+    calls = []
+    analyze_clauses = parallel.analyze_clauses
+
+    def spy(clauses, *args, **kwargs):
+        calls.append(list(clauses))
+        return analyze_clauses(clauses, *args, **kwargs)
+
+    monkeypatch.setattr(parallel, "analyze_clauses", spy)
+    return calls
+
+
+def _upload(client, text: str, previous: int | None = None) -> dict:
+    data = {} if previous is None else {"previous_document_id": str(previous)}
+    response = client.post("/analyze", files={"file": ("contract.txt", text.encode("utf-8"))}, data=data)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _analysis(response: dict) -> dict:
+    return {key: response[key] for key in ("total_clauses", "document_summary", "important_terms", "clauses")}
+
+
+def test_redline_reanalyzes_only_changed_clauses(client, analyzed):
+    original = _upload(client, ORIGINAL)
+    new_text = _redline()
+    before = split_into_clauses(ORIGINAL)
+    changed = [clause for clause in split_into_clauses(new_text) if clause not in before]
+    assert len(changed) == 3
+
+    analyzed.clear()
+    revision = _upload(client, new_text, previous=original["document_id"])
+    assert analyzed == [changed]
+    assert revision["previous_document_id"] == original["document_id"]
+    assert revision["revision"] == {
+        "unchanged": 37, "changed": 3, "added": 0, "removed": 0, "reanalyzed": 3,
+    }
+
+    # Same as analyzing the new text from scratch
+    catalogs.latest().analyzer.cache.clear()
+    analyzed.clear()
+    full = _upload(client, new_text)
+    assert analyzed == [split_into_clauses(new_text)]
+    assert _analysis(revision) == _analysis(full)
+
+
+def test_stale_stored_analyses_are_recomputed(client, analyzed, monkeypatch):
+    original = _upload(client, ORIGINAL)
+    # Stored under this version; a catalog change would give another one
+    monkeypatch.setattr(catalogs.latest().analyzer.cache, "version", "changed catalogs")
+
+    analyzed.clear()
+    revision = _upload(client, ORIGINAL, previous=original["document_id"])
+    assert analyzed == [split_into_clauses(ORIGINAL)]
+    assert revision["revision"]["reanalyzed"] == revision["total_clauses"]
+    assert revision["revision"]["unchanged"] == revision["total_clauses"]
+    assert _analysis(revision) == _analysis(original)
+
+
+def test_unknown_previous_document(client):
+    response = client.post(
+        "/analyze",
+        files={"file": ("contract.txt", ORIGINAL.encode("utf-8"))},
+        data={"previous_document_id": "999999"},
+    )
+    assert response.status_code == 404
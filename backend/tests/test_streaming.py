@@ -0,0 +1,172 @@
+"""
+The incremental ClauseSplitter must give exactly the clauses the original
+split_into_clauses gave for the whole text, however the text is cut into
+chunks; and /analyze/stream must frame the same analysis as /analyze.
+"""
+
+import json
+import random
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main, streaming
+from app.clause_utils import ClauseSplitter, iter_clauses, split_into_clauses
+
+import samples
+
+
+def legacy_split_into_clauses(text: str) -> list[str]:
+    # split_into_clauses as it was before ClauseSplitter
+    if not text:
+        return []
+    text = re.sub(r"\s+", " ", text).strip()
+    splits = re.compile(r"(?:^|\s)(\d+\.\s+)", re.MULTILINE).split(text)
+    clauses = []
+    current_clause = ""
+    for part in splits:
+        if re.match(r"\d+\.\s+", part):
+            if current_clause:
+                clauses.append(current_clause.strip())
+            current_clause = part
+        else:
+            current_clause += " " + part
+    if current_clause:
+        clauses.append(current_clause.strip())
+    return [c for c in clauses if len(c) > 100]
+
+
+def _chunked(text: str, cuts) -> list[str]:
+    cuts = sorted(set(cuts))
+    return [text[start:end] for start, end in zip([0, *cuts], [*cuts, len(text)])]
+
+
+def _incremental(chunks: list[str]) -> list[str]:
+    splitter = ClauseSplitter()
+    clauses = []
+    for chunk in chunks:
+        clauses += splitter.feed(chunk)
+    return clauses + splitter.close()
+
+
+# Pieces of text around clause markers that chunk boundaries can fall inside
+PIECES = ("1", "2", "12", ".", ". ", "  ", "\n", "\n\n", "\t", " 3. ", "4.\n", "1.2 ", "x", "TERMINATION")
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 60)):
+        if rng.random() < 0.4:
+            parts.append(rng.choice(PIECES))
+        else:
+            parts.append(" ".join(rng.sample(samples.FILLER, rng.randint(1, 12))))
+    return "".join(parts)
+
+
+CONTRACT = samples.contract(12, seed=5)
+
+
+def test_contract_split_unchanged():
+    clauses = split_into_clauses(CONTRACT)
+    assert len(clauses) == 12
+    assert clauses == legacy_split_into_clauses(CONTRACT)
+
+
+def test_every_single_cut():
+    expected = legacy_split_into_clauses(CONTRACT)
+    for cut in range(len(CONTRACT) + 1):
+        assert _incremental(_chunked(CONTRACT, [cut])) == expected, cut
+
+
+def test_cuts_inside_a_clause_marker_and_a_heading():
+    text = "\n".join([
+        "9. " + " ".join(samples.FILLER),
+        "PAYMENT TERMS",
+        "10. " + " ".join(reversed(samples.FILLER)),
+        "11. " + " ".join(samples.FILLER[:20]),
+    ])
+    heading = text.index("PAYMENT TERMS") + 4
+    marker = text.index("10. ") + 1
+    expected = legacy_split_into_clauses(text)
+    assert len(expected) == 3
+    for cuts in ([heading], [marker], [heading, marker], [marker, marker + 1, marker + 2]):
+        assert _incremental(_chunked(text, cuts)) == expected, cuts
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_chunking(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        text = _random_text(rng)
+        cuts = [rng.randint(0, len(text)) for _ in range(rng.randint(0, 8))]
+        assert _incremental(_chunked(text, cuts)) == legacy_split_into_clauses(text), (text, cuts)
+
+
+def test_page_chunks():
+    # One chunk per page, pages ending mid-clause
+    text = samples.contract(60, seed=6)
+    pages = _chunked(text, range(0, len(text), 1500))
+    assert list(iter_clauses(pages)) == legacy_split_into_clauses(text)
+
+
+# -------------------------
+# /analyze/stream framing
+# -------------------------
+
+@pytest.fixture
+def client():
+    main.warm_up()
+    return TestClient(main.app)
+
+
+def _post(client, path: str, text: str):
+    return client.post(path, files={"file": ("contract.txt", text.encode("utf-8"))})
+
+
+def _sse_events(body: str) -> list[dict]:
+    events = []
+    assert body.endswith("\n\n")
+    for block in body[:-2].split("\n\n"):
+        name, data = block.split("\n")
+        assert name.startswith("event: ") and data.startswith("data: ")
+        event = json.loads(data[len("data: "):])
+        assert event["event"] == name[len("event: "):]
+        events.append(event)
+    return events
+
+
+def _check_events(events: list[dict], expected: dict):
+    assert [e["event"] for e in events] == ["document", "summary"] + ["clause"] * expected["total_clauses"] + ["done"]
+    assert events[0]["filename"] == "contract.txt"
+    assert events[1]["document_summary"] == expected["document_summary"]
+    assert events[1]["important_terms"] == expected["important_terms"]
+    assert [
+        {"clause_text": e["clause_text"], "analysis": e["analysis"]} for e in events[2:-1]
+    ] == expected["clauses"]
+    assert [e["index"] for e in events[2:-1]] == list(range(expected["total_clauses"]))
+    assert events[-1] == {"event": "done", "total_clauses": expected["total_clauses"]}
+
+
+def test_ndjson_stream(client):
+    text = samples.contract(30, seed=7)
+    expected = _post(client, "/analyze", text).json()
+    response = _post(client, "/analyze/stream", text)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(streaming.MEDIA_TYPES["ndjson"])
+    assert response.text.endswith("\n")
+    _check_events([json.loads(line) for line in response.text.splitlines()], expected)
+
+
+def test_sse_stream(client):
+    text = samples.contract(30, seed=7)
+    expected = _post(client, "/analyze", text).json()
+    response = _post(client, "/analyze/stream?format=sse", text)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(streaming.MEDIA_TYPES["sse"])
+    _check_events(_sse_events(response.text), expected)
+
+
+def test_stream_rejects_short_text(client):
+    response = _post(client, "/analyze/stream", "too short")
+    assert response.status_code == 400
@@ -0,0 +1,266 @@
+"""
+Deterministic synthetic contracts for benchmarking.
+
+Builds NDAs, leases and master services agreements of any number of
+numbered clauses from per-kind clause templates, with the blanks (parties,
+amounts, periods, places) filled from a seeded random generator: the same
+kind, size and seed always give the same text and the same PDF bytes. Some
+templates carry the risky wording the rule catalogs look for, others are
+boilerplate, so the engines see a realistic mix of hits and misses.
+
+The PDFs are minimal PDF 1.4 files (Helvetica, one text object per page)
+written without any PDF library.
+
+Run from the repository root to write a corpus to disk:
+
+    python benchmarks/contracts.py OUT_DIR [--clauses 20,100,500] [--seed 0]
+"""
+
+import argparse
+import random
+import textwrap
+from pathlib import Path
+
+
+KINDS = ("nda", "lease", "msa")
+
+TITLES = {
+    "nda": "MUTUAL NON-DISCLOSURE AGREEMENT",
+    "lease": "RESIDENTIAL LEASE AGREEMENT",
+    "msa": "MASTER SERVICES AGREEMENT",
+}
+
+# The two parties of each kind of contract: (first, second)
+ROLES = {
+    "nda": ("Disclosing Party", "Receiving Party"),
+    "lease": ("Landlord", "Tenant"),
+    "msa": ("Provider", "Client"),
+}
+
+COMPANIES = (
+    "Acme Analytics LLC", "Northwind Holdings Inc.", "Bluefield Software Ltd.",
+    "Harbor Point Properties LLC", "Crescent Logistics Corp.", "Summit Ridge Partners LP",
+    "Ironwood Data Systems Inc.", "Maple Street Realty LLC", "Orion Health Services Inc.",
+)
+PEOPLE = (
+    "Jordan Lee", "Samira Patel", "Alex Moreno", "Chris Okafor", "Dana Kowalski",
+    "Taylor Nguyen", "Morgan Schmidt", "Riley Haddad", "Casey Brennan",
+)
+STATES = ("Delaware", "New York", "California", "Texas", "Illinois", "Washington", "Colorado")
+CITIES = ("Wilmington", "New York", "San Francisco", "Austin", "Chicago", "Seattle", "Denver")
+
+# Clause templates: (heading, body). {a}/{b} are the two roles, the other
+# blanks are filled by _fill.
+COMMON = (
+    ("Governing Law", "This Agreement shall be governed by and construed in accordance with the laws of the State of {state}, without regard to its conflict of laws principles."),
+    ("Jurisdiction", "Any dispute arising out of this Agreement shall be brought exclusively in the state or federal courts located in {city}, {state}, and each party waives any objection to venue in such courts."),
+    ("Arbitration", "Any dispute shall be resolved by binding arbitration administered in {city}. The parties waive the right to a jury trial and to participate in any class action."),
+    ("Notices", "All notices under this Agreement shall be in writing and delivered by courier or certified mail to the addresses set out above, and shall be deemed given {days} days after dispatch."),
+    ("Entire Agreement", "This Agreement constitutes the entire agreement between the parties and supersedes all prior understandings, proposals and communications, whether written or oral."),
+    ("Amendments", "{a} may modify these terms at any time by posting a revised version, and continued performance by {b} after such posting constitutes acceptance of the changes."),
+    ("Amendments", "No amendment to this Agreement shall be effective unless made in writing and signed by authorized representatives of both parties."),
+    ("Assignment", "{b} may not assign this Agreement without the prior written consent of {a}. {a} may assign this Agreement without consent to any affiliate or successor."),
+    ("Severability", "If any provision of this Agreement is held invalid or unenforceable, the remaining provisions shall continue in full force and effect."),
+    ("Waiver", "Failure by either party to enforce any provision shall not constitute a waiver of that provision or of any other provision of this Agreement."),
+    ("Force Majeure", "Neither party shall be liable for delay caused by events beyond its reasonable control, including acts of God, fire, flood, pandemic, war or government action, provided it gives notice within {days} days."),
+    ("Counterparts", "This Agreement may be executed in counterparts, each of which shall be deemed an original, and electronic signatures shall be binding."),
+)
+
+TEMPLATES = {
+    "nda": COMMON + (
+        ("Confidential Information", "Confidential Information means all non-public business, technical and financial information disclosed by {a} to {b}, whether orally or in writing, including trade secrets and source code."),
+        ("Obligations of the Receiving Party", "{b} shall hold the Confidential Information in strict confidence, use it solely to evaluate the proposed transaction, and restrict disclosure to employees with a need to know."),
+        ("Exclusions", "The obligations above do not apply to information that is publicly available, already known to {b}, or independently developed without use of the Confidential Information."),
+        ("Term of Confidentiality", "The confidentiality obligations survive termination of this Agreement and continue in perpetuity for trade secrets and for {years} years for all other Confidential Information."),
+        ("Return of Materials", "Upon request, {b} shall promptly return or destroy all Confidential Information and certify destruction in writing within {days} days."),
+        ("Non-Solicitation", "For {years} years after the Effective Date, {b} shall not solicit or hire any employee of {a} with whom it had contact in connection with this Agreement."),
+        ("Non-Compete", "{b} shall not engage in any competing business anywhere in the world for a period of {years} years following termination of this Agreement."),
+        ("Remedies", "{b} acknowledges that a breach may cause irreparable harm, and {a} shall be entitled to injunctive relief without the posting of a bond, in addition to any other remedy."),
+        ("Indemnification", "{b} shall indemnify and hold harmless {a} from any and all claims, losses and expenses, including attorneys fees, arising from any unauthorized disclosure."),
+        ("No License", "Nothing in this Agreement grants {b} any license or right in the Confidential Information, and all intellectual property remains the sole property of {a}."),
+        ("Term and Termination", "This Agreement shall remain in effect for {years} years. {a} may terminate at any time without notice, while {b} may only terminate for material breach."),
+    ),
+    "lease": COMMON + (
+        ("Premises", "{a} leases to {b} the residential premises located at {number} Main Street, {city}, {state}, together with the fixtures and appliances listed in Schedule A."),
+        ("Term", "The lease term begins on the first day of the month and continues for {months} months. The lease shall automatically renew for successive one-year terms unless either party gives {days} days written notice."),
+        ("Rent", "{b} shall pay monthly rent of ${amount} in advance on the first day of each month by bank transfer to the account designated by {a}."),
+        ("Late Fees", "If rent is not received within {days} days of the due date, {b} shall pay a late fee of ${fee} plus interest of {percent}% per month on the overdue amount."),
+        ("Security Deposit", "{b} shall pay a security deposit of ${amount}. The deposit is non-refundable and may be applied by {a} to any amounts owed at its sole discretion."),
+        ("Rent Increases", "{a} may increase the rent at any time upon {days} days notice, and may adjust the rent at its sole discretion upon any renewal."),
+        ("Use of Premises", "{b} shall use the premises solely as a private residence and shall not conduct any business, sublet or allow occupancy by more than {people} persons."),
+        ("Maintenance and Repairs", "{b} is responsible for all repairs and maintenance of the premises, including structural repairs and appliance replacement, regardless of cause."),
+        ("Entry by Landlord", "{a} may enter the premises at any time without prior notice for inspection, repairs or to show the premises to prospective tenants."),
+        ("Utilities", "{b} shall pay all utilities, including water, gas, electricity, internet and waste removal, and shall keep all accounts current."),
+        ("Pets", "No pets are permitted on the premises without the prior written consent of {a}, which may be withheld for any reason."),
+        ("Default and Eviction", "If {b} fails to pay rent when due, {a} may terminate the lease immediately and begin eviction proceedings, and {b} waives any right to a hearing."),
+        ("Liability", "{a} shall not be liable for any injury, loss or damage to persons or property on the premises, including damage caused by the negligence of {a}."),
+        ("Insurance", "{b} shall maintain renters insurance with liability coverage of at least ${amount} and name {a} as an additional insured."),
+        ("Early Termination", "If {b} terminates this lease before the end of the term, {b} shall pay an early termination fee equal to {months} months of rent, and all prepaid amounts are forfeited."),
+    ),
+    "msa": COMMON + (
+        ("Services", "{a} shall provide the services described in each Statement of Work executed by the parties. Each Statement of Work is governed by this Agreement."),
+        ("Fees and Payment", "{b} shall pay all fees within {days} days of the invoice date. Fees are non-refundable, and overdue amounts bear interest at {percent}% per month."),
+        ("Price Changes", "{a} may change its fees at any time upon {days} days notice, and the new fees apply to all subsequent invoices."),
+        ("Term and Renewal", "This Agreement commences on the Effective Date and continues for {months} months, and shall automatically renew for additional terms of {months} months unless terminated."),
+        ("Termination", "{a} may terminate this Agreement or suspend the services at any time for any reason. {b} may only terminate for material breach after a cure period of {days} days."),
+        ("Suspension", "{a} may suspend access to the services immediately and without notice if any invoice remains unpaid or if {a} suspects misuse."),
+        ("Warranties", "The services are provided as is and as available, and {a} disclaims all warranties, express or implied, including merchantability and fitness for a particular purpose."),
+        ("Limitation of Liability", "In no event shall {a} be liable for any indirect, incidental, special or consequential damages, and its total liability shall not exceed the fees paid in the {months} months preceding the claim."),
+        ("Indemnification", "{b} shall indemnify, defend and hold harmless {a} and its affiliates from any third party claims arising out of {b}'s use of the services."),
+        ("Intellectual Property", "All work product, deliverables and intellectual property created under this Agreement shall be the exclusive property of {a}, and {b} assigns all rights therein to {a}."),
+        ("Data Processing", "{a} may collect, use and share usage data and customer data with third parties for analytics and marketing purposes."),
+        ("Service Levels", "{a} shall use commercially reasonable efforts to make the services available {percent}% of the time, measured monthly, excluding scheduled maintenance."),
+        ("Subcontractors", "{a} may engage subcontractors to perform the services without notice to {b} and remains responsible for their performance."),
+        ("Audit", "{a} may audit {b}'s use of the services upon {days} days notice, and {b} shall pay the costs of any audit revealing underpayment."),
+        ("Non-Solicitation", "During the term and for {years} years thereafter, {b} shall not solicit or hire any employee or contractor of {a}."),
+    ),
+}
+
+
+def _fill(template: str, rnd: random.Random, roles: tuple) -> str:
+    return template.format(
+        a=roles[0],
+        b=roles[1],
+        state=rnd.choice(STATES),
+        city=rnd.choice(CITIES),
+        days=rnd.choice((5, 7, 10, 14, 15, 30, 45, 60, 90)),
+        months=rnd.choice((1, 3, 6, 12, 24, 36)),
+        years=rnd.choice((1, 2, 3, 5)),
+        amount=f"{rnd.randrange(500, 25000, 50):,}",
+        fee=rnd.choice((25, 50, 75, 100, 150)),
+        percent=rnd.choice((1.5, 2, 5, 10, 18, 99.5)),
+        number=rnd.randrange(10, 9999),
+        people=rnd.randrange(2, 7),
+    )
+
+
+def generate(kind: str, clauses: int, seed: int = 0) -> str:
+    """
+    A contract of the given kind with `clauses` numbered clauses after its
+    preamble. Templates are used in a shuffled order and reused (with new
+    blanks) once all have been used.
+    """
+    if kind not in TEMPLATES:
+        raise ValueError(f"Unknown contract kind {kind!r}; expected one of {', '.join(KINDS)}")
+    rnd = random.Random(f"{kind}:{clauses}:{seed}")
+    roles = ROLES[kind]
+    templates = TEMPLATES[kind]
+
+    first = rnd.choice(COMPANIES)
+    second = rnd.choice([c for c in COMPANIES + PEOPLE if c != first])
+    lines = [
+        TITLES[kind],
+        "",
+        f"This {TITLES[kind].title()} (the \"Agreement\") is entered into as of "
+        f"{rnd.choice(('January', 'March', 'June', 'September'))} {rnd.randrange(1, 29)}, "
+        f"{rnd.randrange(2019, 2027)} by and between {first} (the \"{roles[0]}\") and "
+        f"{second} (the \"{roles[1]}\").",
+        "",
+    ]
+    order = []
+    for number in range(1, clauses + 1):
+        if not order:
+            order = list(templates)
+            rnd.shuffle(order)
+        heading, body = order.pop()
+        lines.append(f"{number}. {heading.upper()}. {_fill(body, rnd, roles)}")
+        lines.append("")
+    lines.append("IN WITNESS WHEREOF, the parties have executed this Agreement as of the Effective Date.")
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------
+# PDF Rendering
+# -------------------------
+
+LINE_WIDTH = 95
+LINES_PER_PAGE = 62
+
+
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _pdf_objects(pages: list[list[str]]) -> list[bytes]:
+    # Object numbers: 1 font, then a content stream and a page per page,
+    # then the page tree and the catalog
+    pages_id = 2 + 2 * len(pages)
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        stream = (
+            "BT /F1 9 Tf 12 TL 40 800 Td "
+            + " ".join(f"({_escape(line)}) Tj T*" for line in lines)
+            + " ET"
+        ).encode("latin-1", errors="replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 842] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 1 0 R >> >> >>" % (pages_id, content_id)
+        )
+        kids.append(len(objects))
+    objects.append(
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+    )
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    return objects
+
+
+def to_pdf(text: str) -> bytes:
+    """The text laid out as a PDF, wrapped to LINE_WIDTH characters per line."""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, LINE_WIDTH) or [""])
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects = _pdf_objects(pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects), xref
+    )
+    return bytes(out)
+
+
+def corpus(sizes: list[int], seed: int = 0, kinds: tuple = KINDS) -> list[dict]:
+    """One contract per kind and size: {"name", "kind", "clauses", "text", "pdf"}."""
+    documents = []
+    for kind in kinds:
+        for clauses in sizes:
+            text = generate(kind, clauses, seed)
+            documents.append({
+                "name": f"{kind}-{clauses}",
+                "kind": kind,
+                "clauses": clauses,
+                "text": text,
+                "pdf": to_pdf(text),
+            })
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("out", type=Path, help="directory to write NAME.txt and NAME.pdf to")
+    parser.add_argument("--clauses", default="20,100,500", help="comma-separated contract sizes")
+    parser.add_argument("--kinds", default=",".join(KINDS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    sizes = [int(size) for size in args.clauses.split(",")]
+    for document in corpus(sizes, args.seed, tuple(args.kinds.split(","))):
+        (args.out / f"{document['name']}.txt").write_text(document["text"], encoding="utf-8")
+        (args.out / f"{document['name']}.pdf").write_bytes(document["pdf"])
+        print(f"{document['name']}: {len(document['text'])} chars, {len(document['pdf'])} PDF bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+How rules/engine's pattern matching scales with the number of patterns.
+
+For growing prefixes of the extra.py catalog, times three ways of finding
+which rules fire in one lowercased document:
+
+- search:      one precompiled re.search per pattern (the previous engine)
+- alternation: a single "p1|p2|..." regex, one lookahead finditer pass
+- trie:        rules.engine.PatternMatcher (trie-shaped regex, one pass)
+
+Run from the repository root:
+
+    python benchmarks/engine_patterns.py [--size 200000] [--json out.json]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app import extra  # noqa: E402
+from app.rules.engine import PatternMatcher  # noqa: E402
+
+
+FILLER = (
+    "the party shall provide services under this agreement and pay all "
+    "amounts when due subject to the terms set out in the schedule"
+).split()
+
+
+def synthetic_document(size: int, seed: int = 0) -> str:
+    """Filler prose with catalog patterns sprinkled in, about `size` characters."""
+    rnd = random.Random(seed)
+    patterns = [p for rule in extra.RULES for p in rule.patterns]
+    words = []
+    length = 0
+    while length < size:
+        word = rnd.choice(patterns) if rnd.random() < 0.02 else rnd.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words).lower()
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(size: int, repeat: int, max_alternation: int) -> list[dict]:
+    text = synthetic_document(size)
+    results = []
+    total = sum(len(rule.patterns) for rule in extra.RULES)
+    counts = sorted({n for n in (16, 32, 64, 128, 256, 512) if n < total} | {total})
+    for count in counts:
+        # Whole rules, up to `count` patterns
+        rules, patterns = [], 0
+        for rule in extra.RULES:
+            if patterns + len(rule.patterns) > count and rules:
+                break
+            rules.append(rule)
+            patterns += len(rule.patterns)
+
+        compiled = [re.compile(p) for rule in rules for p in rule.patterns]
+        matcher = PatternMatcher(rules)
+        row = {
+            "patterns": patterns,
+            "rules": len(rules),
+            "search_s": best_of(lambda: [p.search(text) for p in compiled], repeat),
+            "trie_s": best_of(lambda: matcher.fired(text), repeat),
+            "alternation_s": None,
+        }
+        if patterns <= max_alternation:
+            # One group per rule; lastindex tells which rule matched
+            alternation = re.compile(
+                "(?=" + "|".join("(" + "|".join(rule.patterns) + ")" for rule in rules) + ")"
+            )
+            row["alternation_s"] = best_of(lambda: set(m.lastindex for m in alternation.finditer(text)), 1)
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--size", type=int, default=200_000, help="document size in characters")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-alternation", type=int, default=128,
+        help="largest pattern count timed with the single alternation (it is slow)",
+    )
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat, args.max_alternation)
+
+    def fmt(seconds):
+        return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+    print(f"{args.size} characters; times in ms (best of {args.repeat})")
+    print(f"{'patterns':>8} {'rules':>6} {'search':>8} {'trie':>8} {'alternation':>12}")
+    for row in results:
+        print(
+            f"{row['patterns']:>8} {row['rules']:>6} {fmt(row['search_s']):>8} "
+            f"{fmt(row['trie_s']):>8} {fmt(row['alternation_s']):>12}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps({"size": args.size, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Timings of each analysis stage over a synthetic contract corpus.
+
+For every contract from benchmarks/contracts.py (one per kind and size),
+times, best of --repeat:
+
+- extract_text:      pdf_utils.extract_text_from_pdf on the contract's PDF
+- split_clauses:     clause_utils.split_into_clauses on its text
+- analyze_clause:    analyzer.analyze_clause on every clause, one by one,
+                     with the clause result cache emptied first
+- analyze_document:  analyzer.analyze_document on the text
+- extra_rules:       extra.analyze_document_with_rules on the text
+- endpoint:          POST /analyze of the PDF through FastAPI's TestClient
+                     (a scratch SQLite database, clause cache emptied first)
+
+Results are written as JSON; pass an earlier run as --compare to print how
+every timing changed.
+
+Run from the repository root:
+
+    python benchmarks/pipeline.py [--clauses 20,100,500] [--repeat 5]
+        [--json out.json] [--compare before.json]
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS.parent / "backend"))
+sys.path.insert(0, str(BENCHMARKS))
+
+import contracts  # noqa: E402
+
+STAGES = ("extract_text", "split_clauses", "analyze_clause", "analyze_document", "extra_rules", "endpoint")
+
+
+def best_of(fn, repeat: int, setup=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list[int], repeat: int, seed: int) -> dict:
+    # The scratch database must be configured before app.database is imported
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/pipeline.db"
+        return _run(sizes, repeat, seed)
+
+
+def _run(sizes: list[int], repeat: int, seed: int) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app import analyzer, catalogs, extra, main
+    from app.clause_utils import split_into_clauses
+    from app.pdf_utils import extract_text_from_pdf
+
+    main.warm_up()
+    client = TestClient(main.app)
+    cache = catalogs.latest().analyzer.cache
+
+    def post(document):
+        response = client.post("/analyze", files={"file": (f"{document['name']}.pdf", document["pdf"])})
+        response.raise_for_status()
+
+    results = []
+    for document in contracts.corpus(sizes, seed):
+        text = document["text"]
+        clauses = split_into_clauses(text)
+        timings = {
+            "extract_text": best_of(lambda: extract_text_from_pdf(io.BytesIO(document["pdf"])), repeat),
+            "split_clauses": best_of(lambda: split_into_clauses(text), repeat),
+            "analyze_clause": best_of(lambda: [analyzer.analyze_clause(c) for c in clauses], repeat, cache.clear),
+            "analyze_document": best_of(lambda: analyzer.analyze_document(text), repeat),
+            "extra_rules": best_of(lambda: extra.analyze_document_with_rules(text), repeat),
+            "endpoint": best_of(lambda: post(document), repeat, cache.clear),
+        }
+        results.append({
+            "name": document["name"],
+            "kind": document["kind"],
+            "clauses": len(clauses),
+            "chars": len(text),
+            "pdf_bytes": len(document["pdf"]),
+            "seconds": timings,
+        })
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "documents": results,
+    }
+
+
+def _print(results: dict, baseline: dict | None):
+    before = {doc["name"]: doc["seconds"] for doc in baseline["documents"]} if baseline else {}
+    print(f"ms, best of {results['repeat']}" + (" (change vs. baseline)" if baseline else ""))
+    print(f"{'document':<11} {'clauses':>7}" + "".join(f" {stage:>18}" for stage in STAGES))
+    for doc in results["documents"]:
+        cells = []
+        for stage in STAGES:
+            ms = f"{doc['seconds'][stage] * 1000:.2f}"
+            old = before.get(doc["name"], {}).get(stage)
+            if old:
+                ms += f" ({doc['seconds'][stage] / old - 1:+.0%})"
+            cells.append(f" {ms:>18}")
+        print(f"{doc['name']:<11} {doc['clauses']:>7}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--clauses", default="20,100,500", help="comma-separated contract sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    parser.add_argument("--compare", type=Path, help="results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results = run([int(size) for size in args.clauses.split(",")], args.repeat, args.seed)
+    _print(results, baseline)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
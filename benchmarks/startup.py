@@ -0,0 +1,147 @@
+"""
+Where backend.app.main spends its startup time.
+
+Two measurements, each in fresh interpreters:
+
+- imports:  `python -X importtime` over importing app.main and then
+            running its warm_up(), summarized as the slowest top-level
+            imports (cumulative) and modules (self time)
+- serving:  uvicorn started on a free port, timed until "/" first answers
+            (the app is healthy) and until "/ready" returns 200 (database
+            set up and catalogs loaded by the background warm-up)
+
+Run from the repository root:
+
+    python benchmarks/startup.py [--runs 3] [--top 15] [--json out.json]
+
+Set CLARISCAN_RULES_SNAPSHOT=/nonexistent to time a start that compiles the
+catalogs instead of loading app/compiled_rules.snapshot.
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1] / "backend"
+
+
+def import_times() -> list[dict]:
+    """
+    One `-X importtime` run: self and cumulative seconds per imported module.
+    What main imports itself and what its warm-up imports are both top level.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main; app.main.warm_up()"],
+            cwd=BACKEND, env=dict(os.environ, DATABASE_URL=f"sqlite:///{tmp}/startup.db"),
+            capture_output=True, text=True, check=True,
+        )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            # Nesting level in the import tree; 0 was imported by the statement
+            # or by warm_up()
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_s": int(self_us) / 1e6,
+            "cumulative_s": int(cumulative_us) / 1e6,
+        })
+    return rows
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _status(url: str) -> int | None:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except OSError:
+        return None
+
+
+def serve_times(timeout: float = 60.0) -> dict:
+    """Seconds from spawning uvicorn until "/" answers and until "/ready" is 200."""
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp}/startup.db")
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+            cwd=BACKEND, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        times = {"healthy_s": None, "ready_s": None}
+        try:
+            while time.perf_counter() - start < timeout and times["ready_s"] is None:
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+                if times["healthy_s"] is None and _status(base + "/") == 200:
+                    times["healthy_s"] = time.perf_counter() - start
+                if times["healthy_s"] is not None and _status(base + "/ready") == 200:
+                    times["ready_s"] = time.perf_counter() - start
+                time.sleep(0.005)
+        finally:
+            server.terminate()
+            server.wait()
+    return times
+
+
+def run(runs: int) -> dict:
+    # Best of `runs` for every module, each a fresh interpreter
+    best: dict[str, dict] = {}
+    for _ in range(runs):
+        for row in import_times():
+            kept = best.get(row["module"])
+            if kept is None or row["cumulative_s"] < kept["cumulative_s"]:
+                best[row["module"]] = row
+    serving = [serve_times() for _ in range(runs)]
+    return {
+        "runs": runs,
+        "imports": sorted(best.values(), key=lambda row: -row["cumulative_s"]),
+        "healthy_s": min(s["healthy_s"] for s in serving),
+        "ready_s": min(s["ready_s"] for s in serving),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per measurement")
+    parser.add_argument("--top", type=int, default=15, help="rows per import table")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    imports = results["imports"]
+
+    print(f"times in ms (best of {args.runs})")
+    print("\nslowest top-level imports (cumulative)")
+    for row in [row for row in imports if row["depth"] == 0][:args.top]:
+        print(f"{row['cumulative_s'] * 1000:>9.1f}  {row['module']}")
+    print("\nslowest modules (self)")
+    for row in sorted(imports, key=lambda row: -row["self_s"])[:args.top]:
+        print(f"{row['self_s'] * 1000:>9.1f}  {row['module']}")
+    print(f"\nuvicorn start -> '/' 200:      {results['healthy_s'] * 1000:>7.0f}")
+    print(f"uvicorn start -> '/ready' 200: {results['ready_s'] * 1000:>7.0f}")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()